@@ -39,8 +39,8 @@ def extract_readable_text(html: str) -> str:
     return text
 
 
-def fetch_and_save(url: str, out_dir: str) -> dict:
-    resp = requests.get(url, timeout=30)
+def fetch_and_save(url: str, out_dir: str, session=requests) -> dict:
+    resp = session.get(url, timeout=30)
     resp.raise_for_status()
     text = extract_readable_text(resp.text)
     parsed = urlparse(url)
@@ -58,13 +58,15 @@ def main():
         os.makedirs(training_dir, exist_ok=True)
 
     summary = {"saved": []}
-    for url in MIKROTIK_URLS:
-        try:
-            info = fetch_and_save(url, training_dir)
-            summary["saved"].append(info)
-            time.sleep(0.5)
-        except Exception as e:
-            summary["saved"].append({"url": url, "error": str(e)})
+    # All pages live on one host; a shared session keeps the TLS connection alive.
+    with requests.Session() as session:
+        for url in MIKROTIK_URLS:
+            try:
+                info = fetch_and_save(url, training_dir, session)
+                summary["saved"].append(info)
+                time.sleep(0.5)
+            except Exception as e:
+                summary["saved"].append({"url": url, "error": str(e)})
 
     index_path = os.path.join(training_dir, "mikrotik_docs_index.json")
     with open(index_path, "w", encoding="utf-8") as f:
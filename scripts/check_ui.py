@@ -1,9 +1,14 @@
+import re
 from pathlib import Path
 p = Path(__file__).resolve().parents[1] / 'vm_deployment' / 'nexus.html'
-s = p.read_text(encoding='utf-8')
-print('len', len(s))
-print('ftthModal', 'ftthModal' in s)
-print('ftthQuickBtn', 'ftthQuickBtn' in s)
-print('ftthGenerate', 'ftthGenerate' in s)
-print('generateFtthBng', 'generateFtthBng' in s)
-print('preview snippet:\n', s[s.find('ftthModal')-60:s.find('ftthModal')+60])
+# Scan the raw bytes once for all markers instead of decoding and running one search per marker
+data = p.read_bytes()
+MARKERS = (b'ftthModal', b'ftthQuickBtn', b'ftthGenerate', b'generateFtthBng')
+hits = {}
+for m in re.finditer(b'|'.join(MARKERS), data):
+    hits.setdefault(m.group(), m.start())
+print('len', len(data))
+for marker in MARKERS:
+    print(marker.decode(), marker in hits)
+modal_at = hits.get(b'ftthModal', -1)
+print('preview snippet:\n', data[max(modal_at - 60, 0):modal_at + 60].decode('utf-8', errors='replace') if modal_at >= 0 else '')
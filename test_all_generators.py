@@ -7,11 +7,24 @@ Tests ALL backend config generators against the VM/local app to verify:
   3. Output is consistent and complete
   4. Key compliance markers present
 """
+import io
 import json
 import os
 import sys
 import re
+import threading
+from dataclasses import dataclass, field
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+
+# orjson is optional; fall back to the stdlib codec when it is not installed
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 if __name__ != "__main__" and "pytest" in sys.modules:
     import pytest
@@ -21,7 +34,23 @@ if __name__ != "__main__" and "pytest" in sys.modules:
 BASE_URL = (os.getenv("NOC_CONFIGMAKER_BASE_URL") or "").strip().rstrip("/")
 
 if BASE_URL:
-    CLIENT = requests
+    # Tests are independent, so against a live server they run side by side
+    MAX_WORKERS = 8
+    # requests.Session is not thread-safe, so each worker keeps its own
+    # keep-alive session instead of sharing one across threads
+    _thread_state = threading.local()
+
+    def get_client():
+        session = getattr(_thread_state, "session", None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS, max_retries=0)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _thread_state.session = session
+        return session
+    # requests takes a pre-encoded body as data=, the httpx-based TestClient as content=
+    BODY_KWARG = "data"
 
     def build_url(path: str) -> str:
         return f"{BASE_URL}{path}"
@@ -32,13 +61,16 @@ else:
     from fastapi_server import app
 
     CLIENT = TestClient(app)
+    # The in-process app shares its state with this interpreter; keep it serial
+    MAX_WORKERS = 1
+
+    def get_client():
+        return CLIENT
+    BODY_KWARG = "content"
 
     def build_url(path: str) -> str:
         return path
 
-PASS = 0
-FAIL = 0
-
 COMPLIANCE_MARKERS = {
     "snmp_community": ("FBZ1yYdphf", "SNMP community string"),
     "dns_primary": ("142.147.112.3", "Primary DNS server"),
@@ -55,65 +87,127 @@ COMPLIANCE_MARKERS = {
     "bgp_acl": ("BGP-ALLOW", "BGP-ALLOW ACL"),
 }
 
-def check(label, condition):
-    global PASS, FAIL
-    if condition:
-        PASS += 1
-        print(f"    [PASS] {label}")
-    else:
-        FAIL += 1
-        print(f"    [FAIL] {label}")
+# One pass over a config finds every marker. The lookahead lets matches overlap,
+# so a marker sharing characters with a neighbouring one is still reported.
+COMPLIANCE_MARKER_RE = re.compile(
+    "(?=(" + "|".join(re.escape(marker) for marker, _ in COMPLIANCE_MARKERS.values()) + "))"
+)
+MARKER_TO_KEY = {marker: key for key, (marker, _) in COMPLIANCE_MARKERS.items()}
+
+# Protocol keywords the tests look for in any letter case; scanning for them
+# directly avoids building a lowercased copy of the config for every check.
+CONFIG_KEYWORDS = ("ospf", "bgp", "dhcp", "vpls", "ldp", "mpls", "nat", "olt", "ftth")
+CONFIG_KEYWORD_RE = re.compile("(?=(" + "|".join(CONFIG_KEYWORDS) + "))", re.IGNORECASE | re.ASCII)
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def encode_json(payload) -> bytes:
+    if HAS_ORJSON:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def decode_json(r):
+    if HAS_ORJSON:
+        return orjson.loads(r.content)
+    return json.loads(r.content)
+
+
+def body_preview(r, limit=400):
+    """Decode only the first limit bytes of a response for error output."""
+    return r.content[:limit].decode("utf-8", errors="replace")
+
+
+def error_detail(r):
+    """Return the JSON "detail" of an error response, else a short body preview."""
+    try:
+        detail = decode_json(r).get("detail")
+    except Exception:
+        detail = None
+    return detail if detail is not None else body_preview(r, 300)
+
+
+def post_json(client, path, body, timeout):
+    """POST an already-encoded JSON body (see the *_BODY constants)."""
+    return client.post(build_url(path), headers=JSON_HEADERS,
+                       timeout=timeout, **{BODY_KWARG: body})
+
+
+@dataclass(slots=True)
+class TestResults:
+    """Checks recorded by one test; each worker fills its own instance."""
+    title: str = ""
+    passes: int = 0
+    fails: int = 0
+    lines: list = field(default_factory=list)
+
+
+def _scan(config):
+    """Return the keys of every compliance marker present in config."""
+    return frozenset(MARKER_TO_KEY[hit] for hit in COMPLIANCE_MARKER_RE.findall(config))
+
+
+def _keywords(config):
+    """Return the lowercased CONFIG_KEYWORDS that appear in config."""
+    return frozenset(hit.lower() for hit in CONFIG_KEYWORD_RE.findall(config))
+
+
+def report(results, text, status=None):
+    """Record an output line; FAIL and EXCEPTION lines count as failures."""
+    if status is None:
+        results.lines.append(f"    {text}")
+        return
+    results.lines.append(f"    [{status}] {text}")
+    if status == "PASS":
+        results.passes += 1
+    elif status in ("FAIL", "EXCEPTION"):
+        results.fails += 1
+
+
+def check(results, label, condition):
+    report(results, label, "PASS" if condition else "FAIL")
     return condition
 
-def check_compliance(config, label, skip_markers=None):
+def check_compliance(results, config, label, skip_markers=None):
     """Check compliance markers in a config string."""
-    skip = skip_markers or []
-    present = 0
-    missing = 0
+    required = COMPLIANCE_MARKERS.keys() - set(skip_markers or ())
+    missing_keys = required - _scan(config)
     for key, (marker, desc) in COMPLIANCE_MARKERS.items():
-        if key in skip:
-            continue
-        if marker in config:
-            present += 1
-        else:
-            missing += 1
-            print(f"    [WARN] Missing compliance marker: {desc} ({marker})")
+        if key in missing_keys:
+            report(results, f"Missing compliance marker: {desc} ({marker})", "WARN")
+    missing = len(missing_keys)
+    present = len(required) - missing
     total = present + missing
     pct = int(100 * present / total) if total > 0 else 0
-    check(f"{label}: {present}/{total} compliance markers ({pct}%)", missing == 0)
+    check(results, f"{label}: {present}/{total} compliance markers ({pct}%)", missing == 0)
     return present, total
 
 # ════════════════════════════════════════════════════
 # TEST 1: GET /api/compliance/blocks (shared by all)
 # ════════════════════════════════════════════════════
-print("=" * 70)
-print("TEST 1: GET /api/compliance/blocks?loopback_ip=10.5.0.1")
-print("=" * 70)
-try:
-    r = CLIENT.get(build_url("/api/compliance/blocks"),
-                     params={"loopback_ip": "10.5.0.1"}, timeout=15)
-    check("Status 200", r.status_code == 200)
-    data = r.json()
-    check("success=true", data.get("success") is True)
-    source = data.get("source", "unknown")
-    check(f"source supported (got: {source})", source in {"gitlab", "bundled-local"})
-    blocks = data.get("blocks", {})
-    check(f"Has blocks ({len(blocks)} keys)", len(blocks) > 5)
-    # Check key blocks have real content
-    for bk in ["ip_services", "dns", "snmp", "clock_ntp", "user_aaa"]:
-        val = blocks.get(bk, "")
-        check(f"Block '{bk}' has content ({len(val)} chars)", len(val) > 10)
-except Exception as e:
-    FAIL += 1
-    print(f"    [EXCEPTION] {e}")
+def run_test_1(results, client):
+    results.title = "TEST 1: GET /api/compliance/blocks?loopback_ip=10.5.0.1"
+    try:
+        r = client.get(build_url("/api/compliance/blocks"),
+                         params={"loopback_ip": "10.5.0.1"}, timeout=15)
+        check(results, "Status 200", r.status_code == 200)
+        data = decode_json(r)
+        check(results, "success=true", data.get("success") is True)
+        source = data.get("source", "unknown")
+        check(results, f"source supported (got: {source})", source in {"gitlab", "bundled-local"})
+        blocks = data.get("blocks", {})
+        check(results, f"Has blocks ({len(blocks)} keys)", len(blocks) > 5)
+        # Check key blocks have real content
+        for bk in ["ip_services", "dns", "snmp", "clock_ntp", "user_aaa"]:
+            val = blocks.get(bk, "")
+            check(results, f"Block '{bk}' has content ({len(val)} chars)", len(val) > 10)
+    except Exception as e:
+        report(results, str(e), "EXCEPTION")
 
 # ════════════════════════════════════════════════════
 # TEST 2: Tower / Non-MPLS Config
 # ════════════════════════════════════════════════════
-print()
-print("=" * 70)
-print("TEST 2: POST /api/mt/tower/config (Tower Non-MPLS)")
-print("=" * 70)
 tower_payload = {
     "router_type": "MT2004",
     "tower_name": "COMPLIANCE-TEST-CN-1",
@@ -141,36 +235,11 @@ tower_payload = {
     ],
     "apply_compliance": True
 }
-try:
-    r = CLIENT.post(build_url("/api/mt/tower/config"), json=tower_payload, timeout=60)
-    check(f"Status 200 (got {r.status_code})", r.status_code == 200)
-    if r.status_code == 200:
-        result = r.json()
-        config = result if isinstance(result, str) else result.get("config", str(result))
-        check(f"Config is string ({len(config)} chars)", isinstance(config, str) and len(config) > 500)
-        check("Has system identity", "COMPLIANCE-TEST-CN-1" in config)
-        check("Has bridge config", "/interface bridge" in config)
-        check("Has OSPF", "ospf" in config.lower())
-        check("Has BGP", "bgp" in config.lower())
-        check("Has DHCP", "dhcp" in config.lower())
-        check("Has loop0", "loop0" in config)
-        check_compliance(config, "Tower compliance")
-    elif r.status_code == 422:
-        print(f"    422 detail: {r.json().get('detail', r.text[:300])}")
-        FAIL += 1
-    else:
-        print(f"    Error: {r.text[:400]}")
-except Exception as e:
-    FAIL += 1
-    print(f"    [EXCEPTION] {e}")
+TOWER_BODY = encode_json(tower_payload)
 
 # ════════════════════════════════════════════════════
 # TEST 3: Non-MPLS Enterprise Config
 # ════════════════════════════════════════════════════
-print()
-print("=" * 70)
-print("TEST 3: POST /api/gen-enterprise-non-mpls (Non-MPLS Enterprise)")
-print("=" * 70)
 enterprise_payload = {
     "public_cidr": "203.0.113.0/30",
     "bh_cidr": "10.100.0.0/30",
@@ -184,32 +253,11 @@ enterprise_payload = {
     "nat_port": "ether8",
     "coords": "33.123,-97.654"
 }
-try:
-    r = CLIENT.post(build_url("/api/gen-enterprise-non-mpls"), json=enterprise_payload, timeout=30)
-    check(f"Status 200 (got {r.status_code})", r.status_code == 200)
-    if r.status_code == 200:
-        data = r.json()
-        config = data.get("config", "") if isinstance(data, dict) else str(data)
-        check(f"Config length ({len(config)} chars)", len(config) > 200)
-        check("Has identity", "ENT-COMPLIANCE-TEST" in config)
-        check("Has public IP", "203.0.113" in config)
-        check("Has backhaul", "10.100.0" in config)
-        check("Has NAT", "nat" in config.lower())
-        # Non-MPLS enterprise uses inject_compliance_blocks()
-        check_compliance(config, "Non-MPLS Enterprise compliance")
-    else:
-        print(f"    Error ({r.status_code}): {r.text[:400]}")
-except Exception as e:
-    FAIL += 1
-    print(f"    [EXCEPTION] {e}")
+ENTERPRISE_BODY = encode_json(enterprise_payload)
 
 # ════════════════════════════════════════════════════
 # TEST 4: MPLS Enterprise / BNG2 Config
 # ════════════════════════════════════════════════════
-print()
-print("=" * 70)
-print("TEST 4: POST /api/mt/bng2/config (MPLS Enterprise / BNG2)")
-print("=" * 70)
 bng2_payload = {
     "router_type": "MT2004",
     "tower_name": "BNG2-COMPLIANCE-TEST",
@@ -238,35 +286,11 @@ bng2_payload = {
     ],
     "apply_compliance": True
 }
-try:
-    r = CLIENT.post(build_url("/api/mt/bng2/config"), json=bng2_payload, timeout=60)
-    check(f"Status 200 (got {r.status_code})", r.status_code == 200)
-    if r.status_code == 200:
-        result = r.json()
-        config = result if isinstance(result, str) else result.get("config", str(result))
-        check(f"Config is string ({len(config)} chars)", isinstance(config, str) and len(config) > 500)
-        check("Has system identity", "BNG2-COMPLIANCE-TEST" in config)
-        check("Has VPLS", "vpls" in config.lower())
-        check("Has MPLS/LDP", "ldp" in config.lower() or "mpls" in config.lower())
-        check("Has OSPF", "ospf" in config.lower())
-        check("Has bridge", "/interface bridge" in config)
-        check_compliance(config, "BNG2/MPLS compliance")
-    elif r.status_code == 422:
-        print(f"    422 detail: {r.json().get('detail', r.text[:300])}")
-        FAIL += 1
-    else:
-        print(f"    Error: {r.text[:400]}")
-except Exception as e:
-    FAIL += 1
-    print(f"    [EXCEPTION] {e}")
+BNG2_BODY = encode_json(bng2_payload)
 
 # ════════════════════════════════════════════════════
 # TEST 5: FTTH BNG Config (generate)
 # ════════════════════════════════════════════════════
-print()
-print("=" * 70)
-print("TEST 5: POST /api/generate-ftth-bng (FTTH BNG)")
-print("=" * 70)
 ftth_payload = {
     "loopback_ip": "10.5.0.3/32",
     "cpe_network": "10.50.0.0/22",
@@ -277,56 +301,121 @@ ftth_payload = {
     "router_identity": "FTTH-COMPLIANCE-TEST",
     "deployment_type": "instate"
 }
-try:
-    r = CLIENT.post(build_url("/api/generate-ftth-bng"), json=ftth_payload, timeout=30)
-    check(f"Status 200 (got {r.status_code})", r.status_code == 200)
-    if r.status_code == 200:
-        data = r.json()
-        config = data.get("config", "") if isinstance(data, dict) else str(data)
-        check(f"Config length ({len(config)} chars)", len(config) > 200)
-        check("Has system identity", "FTTH-COMPLIANCE-TEST" in config or "ftth" in config.lower())
-        check("Has loop0", "loop0" in config)
-        check("Has OLT", "olt" in config.lower() or "10.60.0" in config)
-        # FTTH renderer has its own compliance injection
-        check_compliance(config, "FTTH BNG compliance", skip_markers=[])
-    else:
-        print(f"    Error ({r.status_code}): {r.text[:400]}")
-except Exception as e:
-    FAIL += 1
-    print(f"    [EXCEPTION] {e}")
+FTTH_BODY = encode_json(ftth_payload)
 
 # ════════════════════════════════════════════════════
 # TEST 5b: FTTH BNG OUT-OF-STATE
 # ════════════════════════════════════════════════════
-print()
-print("=" * 70)
-print("TEST 5b: POST /api/generate-ftth-bng (FTTH BNG OUT-OF-STATE)")
-print("=" * 70)
-ftth_outstate = dict(ftth_payload)
-ftth_outstate["deployment_type"] = "outstate"
-ftth_outstate["router_identity"] = "FTTH-OUTSTATE-TEST"
-try:
-    r = CLIENT.post(build_url("/api/generate-ftth-bng"), json=ftth_outstate, timeout=30)
-    check(f"Status 200 (got {r.status_code})", r.status_code == 200)
-    if r.status_code == 200:
-        data = r.json()
-        config = data.get("config", "") if isinstance(data, dict) else str(data)
-        check(f"Config length ({len(config)} chars)", len(config) > 200)
-        check("Has OSPF (out-of-state)", "ospf" in config.lower())
-        check_compliance(config, "FTTH out-of-state compliance", skip_markers=[])
-    else:
-        print(f"    Error ({r.status_code}): {r.text[:400]}")
-except Exception as e:
-    FAIL += 1
-    print(f"    [EXCEPTION] {e}")
+ftth_outstate = {**ftth_payload, "deployment_type": "outstate", "router_identity": "FTTH-OUTSTATE-TEST"}
+FTTH_OUTSTATE_BODY = encode_json(ftth_outstate)
+
+
+# ════════════════════════════════════════════════════
+# TESTS 2-5b: generator endpoints, run from one table
+# ════════════════════════════════════════════════════
+@dataclass(frozen=True, slots=True)
+class GeneratorTest:
+    """One POST-a-payload, expect-a-config test case."""
+    title: str
+    path: str
+    body: bytes
+    timeout: int
+    min_length: int
+    # (label, needles): passes if any needle is present. Needles listed in
+    # CONFIG_KEYWORDS match in any case; everything else is an exact substring.
+    assertions: tuple
+    compliance_label: str
+    length_label: str = "Config length"
+    # Without a "config" key the checks run against the whole response text
+    whole_response: bool = False
+    # A 422 counts as a failure; otherwise it is reported like any other error
+    fail_on_422: bool = False
+
+
+GENERATOR_TESTS = (
+    GeneratorTest(
+        "TEST 2: POST /api/mt/tower/config (Tower Non-MPLS)",
+        "/api/mt/tower/config", TOWER_BODY, 60, 500,
+        (("Has system identity", ("COMPLIANCE-TEST-CN-1",)),
+         ("Has bridge config", ("/interface bridge",)),
+         ("Has OSPF", ("ospf",)),
+         ("Has BGP", ("bgp",)),
+         ("Has DHCP", ("dhcp",)),
+         ("Has loop0", ("loop0",))),
+        "Tower compliance",
+        length_label="Config is string", whole_response=True, fail_on_422=True,
+    ),
+    GeneratorTest(
+        "TEST 3: POST /api/gen-enterprise-non-mpls (Non-MPLS Enterprise)",
+        "/api/gen-enterprise-non-mpls", ENTERPRISE_BODY, 30, 200,
+        (("Has identity", ("ENT-COMPLIANCE-TEST",)),
+         ("Has public IP", ("203.0.113",)),
+         ("Has backhaul", ("10.100.0",)),
+         ("Has NAT", ("nat",))),
+        # Non-MPLS enterprise uses inject_compliance_blocks()
+        "Non-MPLS Enterprise compliance",
+    ),
+    GeneratorTest(
+        "TEST 4: POST /api/mt/bng2/config (MPLS Enterprise / BNG2)",
+        "/api/mt/bng2/config", BNG2_BODY, 60, 500,
+        (("Has system identity", ("BNG2-COMPLIANCE-TEST",)),
+         ("Has VPLS", ("vpls",)),
+         ("Has MPLS/LDP", ("ldp", "mpls")),
+         ("Has OSPF", ("ospf",)),
+         ("Has bridge", ("/interface bridge",))),
+        "BNG2/MPLS compliance",
+        length_label="Config is string", whole_response=True, fail_on_422=True,
+    ),
+    GeneratorTest(
+        "TEST 5: POST /api/generate-ftth-bng (FTTH BNG)",
+        "/api/generate-ftth-bng", FTTH_BODY, 30, 200,
+        (("Has system identity", ("FTTH-COMPLIANCE-TEST", "ftth")),
+         ("Has loop0", ("loop0",)),
+         ("Has OLT", ("olt", "10.60.0"))),
+        # FTTH renderer has its own compliance injection
+        "FTTH BNG compliance",
+    ),
+    GeneratorTest(
+        "TEST 5b: POST /api/generate-ftth-bng (FTTH BNG OUT-OF-STATE)",
+        "/api/generate-ftth-bng", FTTH_OUTSTATE_BODY, 30, 200,
+        (("Has OSPF (out-of-state)", ("ospf",)),),
+        "FTTH out-of-state compliance",
+    ),
+)
+
+
+def run_generator_test(test, results, client):
+    results.title = test.title
+    try:
+        r = post_json(client, test.path, test.body, timeout=test.timeout)
+        check(results, f"Status 200 (got {r.status_code})", r.status_code == 200)
+        if r.status_code == 200:
+            data = decode_json(r)
+            if test.whole_response:
+                config = data if isinstance(data, str) else data.get("config", str(data))
+            else:
+                config = data.get("config", "") if isinstance(data, dict) else str(data)
+            check(results, f"{test.length_label} ({len(config)} chars)",
+                  isinstance(config, str) and len(config) > test.min_length)
+            keywords = _keywords(config)
+            for label, needles in test.assertions:
+                check(results, label, any(
+                    needle in keywords if needle in CONFIG_KEYWORDS else needle in config
+                    for needle in needles
+                ))
+            check_compliance(results, config, test.compliance_label)
+        elif test.fail_on_422 and r.status_code == 422:
+            report(results, f"422 detail: {error_detail(r)}", "FAIL")
+        elif test.fail_on_422:
+            report(results, f"Error: {body_preview(r)}")
+        else:
+            report(results, f"Error ({r.status_code}): {body_preview(r)}")
+    except Exception as e:
+        report(results, str(e), "EXCEPTION")
 
 # ════════════════════════════════════════════════════
 # TEST 5c: FTTH Preview
 # ════════════════════════════════════════════════════
-print()
-print("=" * 70)
-print("TEST 5c: POST /api/preview-ftth-bng (FTTH Preview)")
-print("=" * 70)
 ftth_preview_payload = {
     "loopback_ip": "10.5.0.3/32",
     "cpe_cidr": "10.50.0.0/22",
@@ -334,29 +423,28 @@ ftth_preview_payload = {
     "olt_cidr": "10.60.0.0/29",
     "deployment_type": "instate"
 }
-try:
-    r = CLIENT.post(build_url("/api/preview-ftth-bng"), json=ftth_preview_payload, timeout=30)
-    check(f"Status 200 (got {r.status_code})", r.status_code == 200)
-    if r.status_code == 200:
-        data = r.json()
-        # Preview might have different response structure
-        has_config = "config" in data or "preview" in data or isinstance(data, str)
-        check("Has config in response", has_config)
-        if "config" in data:
-            check(f"Preview length ({len(data['config'])} chars)", len(data["config"]) > 100)
-    else:
-        print(f"    Status {r.status_code}: {r.text[:300]}")
-except Exception as e:
-    FAIL += 1
-    print(f"    [EXCEPTION] {e}")
+FTTH_PREVIEW_BODY = encode_json(ftth_preview_payload)
+
+def run_test_5c(results, client):
+    results.title = "TEST 5c: POST /api/preview-ftth-bng (FTTH Preview)"
+    try:
+        r = post_json(client, "/api/preview-ftth-bng", FTTH_PREVIEW_BODY, timeout=30)
+        check(results, f"Status 200 (got {r.status_code})", r.status_code == 200)
+        if r.status_code == 200:
+            data = decode_json(r)
+            # Preview might have different response structure
+            has_config = "config" in data or "preview" in data or isinstance(data, str)
+            check(results, "Has config in response", has_config)
+            if "config" in data:
+                check(results, f"Preview length ({len(data['config'])} chars)", len(data["config"]) > 100)
+        else:
+            report(results, f"Status {r.status_code}: {body_preview(r, 300)}")
+    except Exception as e:
+        report(results, str(e), "EXCEPTION")
 
 # ════════════════════════════════════════════════════
 # TEST 6: /api/apply-compliance (used by frontend MPLS Enterprise)
 # ════════════════════════════════════════════════════
-print()
-print("=" * 70)
-print("TEST 6: POST /api/apply-compliance (MPLS Enterprise frontend path)")
-print("=" * 70)
 mpls_frontend_config = """/system identity
 set name=MPLS-ENT-TEST
 
@@ -378,32 +466,30 @@ set enabled=yes transport-addresses=10.5.0.100
 add disabled=no name=vpls2000 remote-peer=10.2.0.10 vpls-id=200:0
 add disabled=no name=vpls3000 remote-peer=10.2.0.10 vpls-id=300:0
 """
-try:
-    r = CLIENT.post(build_url("/api/apply-compliance"),
-                     json={"config": mpls_frontend_config, "loopback_ip": "10.5.0.100"},
-                     timeout=15)
-    check(f"Status 200 (got {r.status_code})", r.status_code == 200)
-    if r.status_code == 200:
-        data = r.json()
-        config = data if isinstance(data, str) else data.get("config", str(data))
-        check(f"Config length ({len(config)} chars) > input", len(config) > len(mpls_frontend_config) + 500)
-        check("Original identity preserved", "MPLS-ENT-TEST" in config)
-        check("Original VPLS preserved", "vpls2000" in config)
-        check("Original OSPF preserved", "ospf" in config.lower())
-        check_compliance(config, "apply-compliance overlay")
-    else:
-        print(f"    Error: {r.text[:400]}")
-except Exception as e:
-    FAIL += 1
-    print(f"    [EXCEPTION] {e}")
+MPLS_FRONTEND_BODY = encode_json({"config": mpls_frontend_config, "loopback_ip": "10.5.0.100"})
+
+def run_test_6(results, client):
+    results.title = "TEST 6: POST /api/apply-compliance (MPLS Enterprise frontend path)"
+    try:
+        r = post_json(client, "/api/apply-compliance", MPLS_FRONTEND_BODY, timeout=15)
+        check(results, f"Status 200 (got {r.status_code})", r.status_code == 200)
+        if r.status_code == 200:
+            data = decode_json(r)
+            config = data if isinstance(data, str) else data.get("config", str(data))
+            check(results, f"Config length ({len(config)} chars) > input", len(config) > len(mpls_frontend_config) + 500)
+            check(results, "Original identity preserved", "MPLS-ENT-TEST" in config)
+            check(results, "Original VPLS preserved", "vpls2000" in config)
+            keywords = _keywords(config)
+            check(results, "Original OSPF preserved", "ospf" in keywords)
+            check_compliance(results, config, "apply-compliance overlay")
+        else:
+            report(results, f"Error: {body_preview(r)}")
+    except Exception as e:
+        report(results, str(e), "EXCEPTION")
 
 # ════════════════════════════════════════════════════
 # TEST 7: Tarana should be SKIPPED (regression)
 # ════════════════════════════════════════════════════
-print()
-print("=" * 70)
-print("TEST 7: Tarana config - compliance should be SKIPPED")
-print("=" * 70)
 tarana_config = """# Tarana Sector Configuration
 # Site: TESTSITE
 # Device: tarana-sector-1
@@ -411,47 +497,94 @@ tarana_config = """# Tarana Sector Configuration
 interface eth0
   ip address 10.3.24.200/24
 """
-try:
-    r = CLIENT.post(build_url("/api/apply-compliance"),
-                     json={"config": tarana_config, "loopback_ip": "10.3.24.200"}, timeout=15)
-    check("Status 200", r.status_code == 200)
-    if r.status_code == 200:
-        data = r.json()
-        result = data if isinstance(data, str) else data.get("config", str(data))
-        check("No MikroTik SNMP injected", "FBZ1yYdphf" not in result)
-        check("No MikroTik firewall injected", "/ip firewall filter" not in result)
-        check("Config unchanged", len(result) < len(tarana_config) + 200)
-except Exception as e:
-    FAIL += 1
-    print(f"    [EXCEPTION] {e}")
+TARANA_BODY = encode_json({"config": tarana_config, "loopback_ip": "10.3.24.200"})
+
+def run_test_7(results, client):
+    results.title = "TEST 7: Tarana config - compliance should be SKIPPED"
+    try:
+        r = post_json(client, "/api/apply-compliance", TARANA_BODY, timeout=15)
+        check(results, "Status 200", r.status_code == 200)
+        if r.status_code == 200:
+            data = decode_json(r)
+            result = data if isinstance(data, str) else data.get("config", str(data))
+            check(results, "No MikroTik SNMP injected", "FBZ1yYdphf" not in result)
+            check(results, "No MikroTik firewall injected", "/ip firewall filter" not in result)
+            check(results, "Config unchanged", len(result) < len(tarana_config) + 200)
+    except Exception as e:
+        report(results, str(e), "EXCEPTION")
 
 # ════════════════════════════════════════════════════
 # TEST 8: Health endpoint
 # ════════════════════════════════════════════════════
-print()
-print("=" * 70)
-print("TEST 8: GET /api/health")
-print("=" * 70)
-try:
-    r = CLIENT.get(build_url("/api/health"), timeout=10)
-    check("Status 200", r.status_code == 200)
-    data = r.json()
-    check("Status online", data.get("status") == "online")
-except Exception as e:
-    FAIL += 1
-    print(f"    [EXCEPTION] {e}")
+def run_test_8(results, client):
+    results.title = "TEST 8: GET /api/health"
+    try:
+        r = client.get(build_url("/api/health"), timeout=10)
+        check(results, "Status 200", r.status_code == 200)
+        data = decode_json(r)
+        check(results, "Status online", data.get("status") == "online")
+    except Exception as e:
+        report(results, str(e), "EXCEPTION")
+
+# No test depends on another's result, so all of them can be in flight at once
+TESTS = (
+    run_test_1,
+    *(partial(run_generator_test, test) for test in GENERATOR_TESTS),
+    run_test_5c, run_test_6, run_test_7, run_test_8,
+)
 
 # ════════════════════════════════════════════════════
 # SUMMARY
 # ════════════════════════════════════════════════════
-print()
-print("=" * 70)
-total = PASS + FAIL
-print(f"RESULTS: {PASS} passed, {FAIL} failed out of {total} checks")
-print("=" * 70)
-if FAIL > 0:
-    print(f"\n{FAIL} checks need attention.")
-    sys.exit(1)
-else:
-    print("\nALL CHECKS PASSED!")
-    sys.exit(0)
+def _run(test):
+    results = TestResults()
+    test(results, get_client())
+    return results
+
+
+def server_reachable():
+    """Probe a live server once so a down host fails fast instead of per test."""
+    if not BASE_URL:
+        return True
+    try:
+        get_client().get(build_url("/api/health"), timeout=(0.5, 2))
+    except requests.RequestException:
+        return False
+    return True
+
+
+def main():
+    if not server_reachable():
+        sys.stdout.write(f"API not reachable at {BASE_URL}; no checks were run.\n")
+        sys.exit(1)
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        # map() yields in submission order, so output stays in test-number order
+        all_results = list(executor.map(_run, TESTS))
+
+    # Build the whole report in memory and hand it to stdout in one write
+    out = io.StringIO()
+    total = TestResults()
+    rule = "=" * 70
+    for index, results in enumerate(all_results):
+        if index:
+            out.write("\n")
+        out.write(f"{rule}\n{results.title}\n{rule}\n")
+        if results.lines:
+            out.write("\n".join(results.lines))
+            out.write("\n")
+        total.passes += results.passes
+        total.fails += results.fails
+
+    checks = total.passes + total.fails
+    out.write(f"\n{rule}\nRESULTS: {total.passes} passed, {total.fails} failed out of {checks} checks\n{rule}\n")
+    if total.fails > 0:
+        out.write(f"\n{total.fails} checks need attention.\n")
+    else:
+        out.write("\nALL CHECKS PASSED!\n")
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
+    sys.exit(1 if total.fails > 0 else 0)
+
+if __name__ == "__main__":
+    main()
@@ -179,12 +179,15 @@ def main():
     # ── Step 8: Show diagnostics ──────────────────────────────────────────
     print("\n─── Step 8: Full Diagnostics ───")
     diag = loader.diagnostics()
-    print(f"  Stats:")
-    for k, v in diag["stats"].items():
-        print(f"    {k}: {v}")
-    print(f"  Recent log:")
-    for entry in diag["recent_log"]:
-        print(f"    [{entry['time']}] {entry['type']}: {entry['path']} {entry.get('detail','')}")
+    # Diagnostics are printed as one block rather than one write per entry
+    diag_lines = ["  Stats:"]
+    diag_lines.extend(f"    {k}: {v}" for k, v in diag["stats"].items())
+    diag_lines.append("  Recent log:")
+    diag_lines.extend(
+        f"    [{entry['time']}] {entry['type']}: {entry['path']} {entry.get('detail','')}"
+        for entry in diag["recent_log"]
+    )
+    print("\n".join(diag_lines))
 
     # ── Summary ───────────────────────────────────────────────────────────
     header("RESULT: ALL TESTS PASSED")
@@ -16,6 +16,9 @@ import re
 import sys
 from pathlib import Path
 
+MODEL_HEADER_RE = re.compile(r"(?m)^#\s*model\s*=(.*)$")
+IDENTITY_NAME_RE = re.compile(r'(?m)^\s*/system identity\s*\n\s*set\s+name=([^\n]+)')
+
 
 def _fail(msg: str) -> None:
     raise SystemExit(f"[FAIL] {msg}")
@@ -127,10 +130,10 @@ def main() -> int:
     translated = data.get("translated_config") or ""
     _assert("qsfp28" not in translated, "Translated config still contains qsfp ports for CCR2004 target")
     _assert("sfp-sfpplus4" in translated, "Translated config did not map sfp28-3 -> sfp-sfpplus4 (backhaul policy)")
-    model = re.search(r"(?m)^#\s*model\s*=(.*)$", translated)
+    model = MODEL_HEADER_RE.search(translated)
     _assert(model and "CCR2004" in model.group(1), "Translated config header model not updated to CCR2004")
     # Identity should be rewritten to avoid retaining source device digits (e.g., MT2216 -> MT2004)
-    id_block = re.search(r'(?m)^\s*/system identity\s*\n\s*set\s+name=([^\n]+)', translated)
+    id_block = IDENTITY_NAME_RE.search(translated)
     _assert(id_block and ("MT2216" not in id_block.group(1)) and ("CCR2004" in id_block.group(1) or "2004" in id_block.group(1)), "Identity not updated to target model/digits")
 
     # Switch-maker backend: CCR2004 no-BNG profile should use proper uplink family.
@@ -233,7 +236,7 @@ def main() -> int:
     _assert("/system scheduler" in translated and "name=nightly" in translated, "Strict translate lost scheduler")
     _assert("/system script" in translated and "name=backup" in translated, "Strict translate lost scripts")
     # Identity should be rewritten to reflect target model/digits (MT2004 -> MT2216)
-    id_block = re.search(r'(?m)^\s*/system identity\s*\n\s*set\s+name=([^\n]+)', translated)
+    id_block = IDENTITY_NAME_RE.search(translated)
     _assert(id_block and ("MT2216" in id_block.group(1) or "CCR2216" in id_block.group(1)), "Identity was not updated to target model/digits")
 
     print("[OK] Smoke tests passed")
@@ -8,7 +8,7 @@ Secure OpenAI API integration for RouterOS config generation and validation
 import sys
 import io
 import faulthandler
-from collections import deque
+from collections import Counter, deque
 # Fix Windows console encoding for Unicode - but only if not already wrapped
 # In PyInstaller, stdout/stderr might already be wrapped, so check first
 if sys.platform == 'win32':
@@ -57,7 +57,7 @@ import sqlite3
 import hashlib
 import hmac
 import secrets
-from functools import wraps
+from functools import lru_cache, wraps
 import threading
 import queue
 import uuid
@@ -2702,26 +2702,36 @@ ROUTERBOARD_INTERFACES = {
     }
 }
 
+# The interface database is static, so flatten each model's port groups once
+# instead of rebuilding the list on every lookup.
+_ROUTERBOARD_PORTS = {
+    model_key: tuple(port for group in specs.get('ports', {}).values() for port in group)
+    for model_key, specs in ROUTERBOARD_INTERFACES.items()
+}
+_ROUTERBOARD_PORT_SETS = {model_key: frozenset(ports) for model_key, ports in _ROUTERBOARD_PORTS.items()}
+
 # ========================================
 # INTELLIGENT INTERFACE MIGRATION LOGIC
 # ========================================
 
+# Checked in order, so 'sfp' only catches the plain SFP ports left after the
+# sfp-sfpplus / sfp28 prefixes.
+_INTERFACE_TYPE_PREFIXES = (
+    ('ether', 'ethernet_1g'),
+    ('combo', 'sfp_plus_10g'),
+    ('sfp-sfpplus', 'sfp_plus_10g'),
+    ('sfp28', 'sfp28_25g'),
+    ('qsfp', 'qsfp28_100g'),
+    ('sfp', 'sfp_1g'),
+)
+
+
 def get_interface_type(interface_name):
     """Determine the type of interface from its name"""
-    if interface_name.startswith('ether'):
-        return 'ethernet_1g'
-    elif interface_name.startswith('combo'):
-        return 'sfp_plus_10g'
-    elif interface_name.startswith('sfp-sfpplus'):
-        return 'sfp_plus_10g'
-    elif interface_name.startswith('sfp28'):
-        return 'sfp28_25g'
-    elif interface_name.startswith('qsfp'):
-        return 'qsfp28_100g'
-    elif interface_name.startswith('sfp'):
-        return 'sfp_1g'
-    else:
-        return 'unknown'
+    for prefix, interface_type in _INTERFACE_TYPE_PREFIXES:
+        if interface_name.startswith(prefix):
+            return interface_type
+    return 'unknown'
 
 
 NEXTLINK_ROLE_PRIORITY = {
@@ -2800,6 +2810,28 @@ def _add_role_matches_from_text(port_name, text_value, evidence_prefix, role_sig
                 bucket['evidence'].append(evidence)
 
 
+# Physical RouterOS port names, compiled once for the migration scanners below.
+# Port names are ASCII, so the port patterns use re.ASCII and \b/\d skip
+# Unicode category lookups (likewise the speed patterns further down).
+# Alternatives that share a prefix are grouped under it (in their original
+# order), so the engine picks a branch from the first letters.
+_PHYSICAL_PORT_PATTERN = r'(?:ether\d+|sfp(?:\d+(?:-\d+)?|-sfpplus\d+|28-\d+)|qsfp(?:plus\d+-\d+|28-\d+-\d+|\d+(?:-\d+)?)|combo\d+)'
+_PHYSICAL_PORT_RE = re.compile(rf'\b({_PHYSICAL_PORT_PATTERN})\b', re.ASCII)
+_PHYSICAL_PORT_FULL_RE = re.compile(_PHYSICAL_PORT_PATTERN, re.ASCII)
+# Interface-valued properties (default-name=, interface=, in-/out-interface=,
+# interfaces=, slaves=) found in one pass. The lookahead keeps every start
+# position, so in-interface= also yields its interface= match as before.
+_PHYSICAL_REFERENCE_RE = re.compile(
+    r'\b(?=default-name=([^\s\]]+)|(?:in-|out-)?interface=([^\s,]+)|(?:interfaces|slaves)=([^\s]+))'
+)
+_PLAIN_SFP_PORT_RE = re.compile(r'^sfp\d+$', re.ASCII)
+# comment= values (bare token or double-quoted), shared by the per-line scanners
+_COMMENT_VALUE_RE = re.compile(r'comment=([^\s\n"]+|"[^"]+")')
+_COMMENT_ATTR_RE = re.compile(r'\bcomment=([^\s\n"]+|"[^"]+")')
+_TRAILING_NUMBER_RE = re.compile(r'(\d+)(?!.*\d)', re.ASCII)
+
+
+@lru_cache(maxsize=512)
 def _port_sort_key(port_name):
     family_rank = 9
     if port_name.startswith('ether'):
@@ -2808,28 +2840,27 @@ def _port_sort_key(port_name):
         family_rank = 1
     elif port_name.startswith('sfp28-'):
         family_rank = 2
-    elif re.match(r'^sfp\d+$', port_name):
+    elif _PLAIN_SFP_PORT_RE.match(port_name):
         family_rank = 3
     elif port_name.startswith('qsfp'):
         family_rank = 4
-    match = re.search(r'(\d+)(?!.*\d)', port_name)
+    match = _TRAILING_NUMBER_RE.search(port_name)
     number = int(match.group(1)) if match else 999
     return (family_rank, number, port_name)
 
 
 def _all_device_ports(device_key):
-    device = ROUTERBOARD_INTERFACES.get(device_key, {})
-    ports = []
-    for group_ports in device.get('ports', {}).values():
-        ports.extend(group_ports)
-    return ports
+    return _ROUTERBOARD_PORTS.get(device_key, ())
+
+
+def _device_port_set(device_key):
+    return _ROUTERBOARD_PORT_SETS.get(device_key, frozenset())
 
 
 def _extract_physical_interface_tokens(config_text):
-    pattern = r'\b(ether\d+|sfp\d+(?:-\d+)?|sfp-sfpplus\d+|sfp28-\d+|qsfpplus\d+-\d+|qsfp28-\d+-\d+|qsfp\d+(?:-\d+)?|combo\d+)\b'
     seen = set()
     physical = []
-    for match in re.finditer(pattern, config_text or ''):
+    for match in _PHYSICAL_PORT_RE.finditer(config_text or ''):
         port = match.group(1)
         if port not in seen:
             seen.add(port)
@@ -2844,7 +2875,7 @@ def _infer_routerboard_model_from_port_usage(config_text):
 
     scores = {}
     for model_key in ROUTERBOARD_INTERFACES:
-        known_ports = set(_all_device_ports(model_key))
+        known_ports = _device_port_set(model_key)
         overlap = [port for port in physical_ports if port in known_ports]
         if overlap:
             scores[model_key] = {
@@ -2949,6 +2980,38 @@ def _rewrite_migration_metadata(config_text: str, source_model: str, target_mode
     return text
 
 
+def _normalize_model_token(value):
+    return re.sub(r'[^a-z0-9]+', '', value.lower())
+
+
+_ROUTERBOARD_MODEL_ALIASES = {
+    'ccr1036': 'CCR1036-12G-4S',
+    'ccr1072': 'CCR1072-12G-4S+',
+    'ccr2004': 'CCR2004-1G-12S+2XS',
+    'ccr200416g2s': 'CCR2004-16G-2S+',
+    'ccr2004112s2xs': 'CCR2004-1G-12S+2XS',
+    'ccr2116': 'CCR2116-12G-4S+',
+    'ccr2216': 'CCR2216-1G-12XS-2XQ',
+    'rb5009': 'RB5009UG+S+',
+    'rb2011': 'RB2011UiAS',
+    'rb1009': 'RB1009UG+S+',
+    'crs326': 'CRS326-24G-2S+',
+    'crs354': 'CRS354-48G-4S+2Q+',
+    '2216': 'CCR2216-1G-12XS-2XQ',
+    '2116': 'CCR2116-12G-4S+',
+    '2004': 'CCR2004-1G-12S+2XS',
+    '1072': 'CCR1072-12G-4S+',
+    '1036': 'CCR1036-12G-4S',
+    '5009': 'RB5009UG+S+',
+    '2011': 'RB2011UiAS',
+    '1009': 'RB1009UG+S+',
+}
+# Normalized form of every model key, built once instead of per lookup
+_ROUTERBOARD_NORMALIZED_KEYS = {
+    _normalize_model_token(model_key): model_key for model_key in ROUTERBOARD_INTERFACES
+}
+
+
 def resolve_routerboard_model_key(device_name):
     raw = (device_name or '').strip()
     if not raw:
@@ -2956,36 +3019,10 @@ def resolve_routerboard_model_key(device_name):
     if raw in ROUTERBOARD_INTERFACES:
         return raw
 
-    normalized = re.sub(r'[^a-z0-9]+', '', raw.lower())
-    aliases = {
-        'ccr1036': 'CCR1036-12G-4S',
-        'ccr1072': 'CCR1072-12G-4S+',
-        'ccr2004': 'CCR2004-1G-12S+2XS',
-        'ccr200416g2s': 'CCR2004-16G-2S+',
-        'ccr2004112s2xs': 'CCR2004-1G-12S+2XS',
-        'ccr2116': 'CCR2116-12G-4S+',
-        'ccr2216': 'CCR2216-1G-12XS-2XQ',
-        'rb5009': 'RB5009UG+S+',
-        'rb2011': 'RB2011UiAS',
-        'rb1009': 'RB1009UG+S+',
-        'crs326': 'CRS326-24G-2S+',
-        'crs354': 'CRS354-48G-4S+2Q+',
-        '2216': 'CCR2216-1G-12XS-2XQ',
-        '2116': 'CCR2116-12G-4S+',
-        '2004': 'CCR2004-1G-12S+2XS',
-        '1072': 'CCR1072-12G-4S+',
-        '1036': 'CCR1036-12G-4S',
-        '5009': 'RB5009UG+S+',
-        '2011': 'RB2011UiAS',
-        '1009': 'RB1009UG+S+',
-    }
-    if normalized in aliases:
-        return aliases[normalized]
-
-    for model_key in ROUTERBOARD_INTERFACES:
-        if re.sub(r'[^a-z0-9]+', '', model_key.lower()) == normalized:
-            return model_key
-    return raw
+    normalized = _normalize_model_token(raw)
+    if normalized in _ROUTERBOARD_MODEL_ALIASES:
+        return _ROUTERBOARD_MODEL_ALIASES[normalized]
+    return _ROUTERBOARD_NORMALIZED_KEYS.get(normalized, raw)
 
 
 ENTERPRISE_DEVICE_PROFILES = {
@@ -3052,13 +3089,12 @@ def get_mikrotik_identity_prefix(device_name: str, compact: bool = False) -> str
 
 
 def _extract_used_physical_interfaces(config_text, source_device):
-    known_ports = set(_all_device_ports(source_device))
+    known_ports = _device_port_set(source_device)
     if not known_ports:
         return []
     physical = []
     seen = set()
-    pattern = r'\b(ether\d+|sfp\d+(?:-\d+)?|sfp-sfpplus\d+|sfp28-\d+|qsfpplus\d+-\d+|qsfp28-\d+-\d+|qsfp\d+(?:-\d+)?|combo\d+)\b'
-    for match in re.finditer(pattern, config_text or ''):
+    for match in _PHYSICAL_PORT_RE.finditer(config_text or ''):
         port = match.group(1)
         if port in known_ports and port not in seen:
             seen.add(port)
@@ -3068,22 +3104,13 @@ def _extract_used_physical_interfaces(config_text, source_device):
 
 def _extract_physical_interface_references(config_text):
     refs = []
-    patterns = [
-        r'\bdefault-name=([^\s\]]+)',
-        r'\binterface=([^\s,]+)',
-        r'\bin-interface=([^\s,]+)',
-        r'\bout-interface=([^\s,]+)',
-        r'\binterfaces=([^\s]+)',
-        r'\bslaves=([^\s]+)',
-    ]
-    for pattern in patterns:
-        for match in re.finditer(pattern, config_text or '', re.MULTILINE):
-            raw = (match.group(1) or '').strip().strip('"')
-            if not raw:
-                continue
-            for token in [part.strip().strip('"') for part in raw.split(',') if part.strip()]:
-                if re.fullmatch(r'(?:ether\d+|sfp\d+(?:-\d+)?|sfp-sfpplus\d+|sfp28-\d+|qsfpplus\d+-\d+|qsfp28-\d+-\d+|qsfp\d+(?:-\d+)?|combo\d+)', token):
-                    refs.append(token)
+    for match in _PHYSICAL_REFERENCE_RE.finditer(config_text or ''):
+        raw = (match.group(1) or match.group(2) or match.group(3) or '').strip().strip('"')
+        if not raw:
+            continue
+        for token in [part.strip().strip('"') for part in raw.split(',') if part.strip()]:
+            if _PHYSICAL_PORT_FULL_RE.fullmatch(token):
+                refs.append(token)
     return refs
 
 
@@ -3096,7 +3123,7 @@ def audit_target_interface_consistency(config_text, target_device):
             'invalid_reference_count': 0,
             'warnings': ['Unknown target device'],
         }
-    target_ports = set(_all_device_ports(target_device))
+    target_ports = _device_port_set(target_device)
     invalid = sorted({port for port in _extract_physical_interface_references(config_text) if port not in target_ports})
     return {
         'valid': len(invalid) == 0,
@@ -3108,11 +3135,18 @@ def audit_target_interface_consistency(config_text, target_device):
     }
 
 
+_CCR2216_QSFP_PORTS = ('qsfp28-1-1', 'qsfp28-2-1')
+_CCR2216_QSFP_DEFAULT_NAME_RE = re.compile(
+    r'\bdefault-name=(' + '|'.join(map(re.escape, _CCR2216_QSFP_PORTS)) + r')\b',
+    re.ASCII,
+)
+
+
 def _set_target_qsfp_state(config_text, target_device, allow_qsfp_ports):
     if target_device != 'CCR2216-1G-12XS-2XQ':
         return config_text
 
-    qsfp_ports = ['qsfp28-1-1', 'qsfp28-2-1']
+    qsfp_ports = _CCR2216_QSFP_PORTS
     lines = (config_text or '').splitlines()
     out_lines = []
     in_ethernet_section = False
@@ -3125,8 +3159,9 @@ def _set_target_qsfp_state(config_text, target_device, allow_qsfp_ports):
             out_lines.append(line)
             continue
         if in_ethernet_section:
-            matched_port = next((port for port in qsfp_ports if re.search(rf'\bdefault-name={re.escape(port)}\b', line)), None)
-            if matched_port:
+            qsfp_match = _CCR2216_QSFP_DEFAULT_NAME_RE.search(line)
+            if qsfp_match:
+                matched_port = qsfp_match.group(1)
                 seen_ports.add(matched_port)
                 if allow_qsfp_ports:
                     out_lines.append(line)
@@ -3181,7 +3216,7 @@ def analyze_nextlink_port_mapping(config_text, source_device, target_device, all
         allow_qsfp_ports = target_device != 'CCR2216-1G-12XS-2XQ'
     source_mgmt = source_specs.get('management_port', 'ether1')
     target_mgmt = target_specs.get('management_port', 'ether1')
-    source_ports = set(_all_device_ports(source_device))
+    source_ports = _device_port_set(source_device)
     target_ports = _all_device_ports(target_device)
 
     comment_map = {}
@@ -3206,7 +3241,7 @@ def analyze_nextlink_port_mapping(config_text, source_device, target_device, all
         parent = match.group(2).strip().strip('"')
         if name and parent:
             vlan_parent[name] = parent
-            cm = re.search(r'\bcomment=([^\s\n"]+|"[^"]+")', match.group(0))
+            cm = _COMMENT_ATTR_RE.search(match.group(0))
             if cm:
                 logical_comments[name] = cm.group(1).strip().strip('"')
 
@@ -3215,7 +3250,7 @@ def analyze_nextlink_port_mapping(config_text, source_device, target_device, all
         slaves = [part.strip().strip('"') for part in match.group(2).split(',') if part.strip()]
         if name and slaves:
             bond_members[name] = slaves
-            cm = re.search(r'\bcomment=([^\s\n"]+|"[^"]+")', match.group(0))
+            cm = _COMMENT_ATTR_RE.search(match.group(0))
             if cm:
                 logical_comments[name] = cm.group(1).strip().strip('"')
 
@@ -3259,7 +3294,7 @@ def analyze_nextlink_port_mapping(config_text, source_device, target_device, all
         re.MULTILINE,
     ):
         ip_addr, prefix, port = match.group(1), int(match.group(2)), match.group(3)
-        comment_match = re.search(r'\bcomment=([^\s\n"]+|"[^"]+")', match.group(0))
+        comment_match = _COMMENT_ATTR_RE.search(match.group(0))
         if comment_match:
             address_comments.setdefault(port, []).append(comment_match.group(1).strip().strip('"'))
         if port in source_ports:
@@ -3272,7 +3307,7 @@ def analyze_nextlink_port_mapping(config_text, source_device, target_device, all
         re.MULTILINE,
     ):
         port, ip_addr, prefix = match.group(1), match.group(2), int(match.group(3))
-        comment_match = re.search(r'\bcomment=([^\s\n"]+|"[^"]+")', match.group(0))
+        comment_match = _COMMENT_ATTR_RE.search(match.group(0))
         if comment_match:
             address_comments.setdefault(port, []).append(comment_match.group(1).strip().strip('"'))
         if port in source_ports:
@@ -3429,16 +3464,17 @@ def analyze_nextlink_port_mapping(config_text, source_device, target_device, all
     radio_pool = ordered_policy_ports[6:11]
     overflow_pool = ordered_policy_ports[11:] + qsfp_ports
 
+    # Free-slot queues per role; slots are handed out from the left
     role_queues = {
-        'switch': list(switch_pool),
-        'olt': list(switch_pool),
-        'backhaul': list(backhaul_pool),
-        'tarana': list(radio_pool),
-        'lte': list(radio_pool),
-        '6ghz': list(radio_pool),
-        'management': [target_mgmt],
-        'infrastructure': list(overflow_pool),
-        'unknown': list(overflow_pool),
+        'switch': deque(switch_pool),
+        'olt': deque(switch_pool),
+        'backhaul': deque(backhaul_pool),
+        'tarana': deque(radio_pool),
+        'lte': deque(radio_pool),
+        '6ghz': deque(radio_pool),
+        'management': deque([target_mgmt]),
+        'infrastructure': deque(overflow_pool),
+        'unknown': deque(overflow_pool),
     }
     fallback_order = {
         'switch': ['switch', 'backhaul', 'tarana', 'lte', '6ghz', 'unknown'],
@@ -3460,9 +3496,9 @@ def analyze_nextlink_port_mapping(config_text, source_device, target_device, all
     def next_port_for_role(role_name):
         nonlocal manual_review_required
         for bucket_name in fallback_order.get(role_name, ['unknown']):
-            queue = role_queues.get(bucket_name, [])
+            queue = role_queues.get(bucket_name, ())
             while queue:
-                candidate = queue.pop(0)
+                candidate = queue.popleft()
                 if candidate == target_mgmt or candidate in used_targets:
                     continue
                 used_targets.add(candidate)
@@ -3592,7 +3628,13 @@ def build_interface_migration_map(source_device, target_device):
     """
     if source_device not in ROUTERBOARD_INTERFACES or target_device not in ROUTERBOARD_INTERFACES:
         return None
-    
+    # The map depends only on the static model table, so it is computed once
+    # per pair; callers get their own dict to mutate.
+    return dict(_interface_migration_pairs(source_device, target_device))
+
+
+@lru_cache(maxsize=256)
+def _interface_migration_pairs(source_device, target_device):
     source = ROUTERBOARD_INTERFACES[source_device]
     target = ROUTERBOARD_INTERFACES[target_device]
     
@@ -3604,11 +3646,12 @@ def build_interface_migration_map(source_device, target_device):
     target_used_ports.add('ether1')
     
     # Get all source interfaces (excluding ether1)
-    source_interfaces = []
-    for port_type, ports in source['ports'].items():
-        for port in ports:
-            if port != 'ether1':
-                source_interfaces.append((port, port_type))
+    source_interfaces = [
+        (port, port_type)
+        for port_type, ports in source['ports'].items()
+        for port in ports
+        if port != 'ether1'
+    ]
     
     # Sort source interfaces to maintain logical order
     # Priority: uplinks first (ether2-3, sfp1-2), then others
@@ -3637,7 +3680,7 @@ def build_interface_migration_map(source_device, target_device):
             migration_map[source_port] = target_port
             target_used_ports.add(target_port)
     
-    return migration_map
+    return tuple(migration_map.items())
 
 def find_best_target_port(source_port, source_type, target_device, used_ports):
     """
@@ -3711,8 +3754,8 @@ def migrate_interface_config(config_text, interface_map, source_device=None, tar
     # Remove stale ethernet defaults for source-only ports that cannot exist on the target.
     # This avoids outputs like `default-name=sfp1` on targets such as CCR2004/CCR2216.
     if source_device in ROUTERBOARD_INTERFACES and target_device in ROUTERBOARD_INTERFACES:
-        source_ports = set(_all_device_ports(source_device))
-        target_ports = set(_all_device_ports(target_device))
+        source_ports = _device_port_set(source_device)
+        target_ports = _device_port_set(target_device)
         stale_source_ports = sorted(
             port for port in source_ports
             if port not in target_ports and port not in interface_map
@@ -3829,6 +3872,37 @@ def detect_device_from_config(config_text):
     
     return None
 
+# RouterOS speed= values before and after the 7.16 rename. Each direction is a
+# single alternation so translate_config rewrites them in one pass.
+_LEGACY_SPEED_NAMES = {
+    '10G-baseSR-LR': '10Gbps',
+    '10G-baseCR': '10Gbps',
+    '1G-baseT-full': '1Gbps',
+    '100M-baseT-full': '100Mbps',
+    '25G-baseR': '25Gbps',
+}
+_LEGACY_SPEED_RE = re.compile(r'\bspeed=(10G-baseSR-LR|10G-baseCR|1G-baseT-full|100M-baseT-full|25G-baseR)\b', re.ASCII)
+_MODERN_SPEED_NAMES = {
+    '10Gbps': '10G-baseSR-LR',
+    '10G-baseCR': '10G-baseSR-LR',
+    '1Gbps': '1G-baseT-full',
+    '100Mbps': '100M-baseT-full',
+    '25Gbps': '25G-baseR',
+}
+# 10G-baseCR must not be followed by '-', so an existing suffix is never doubled
+_MODERN_SPEED_RE = re.compile(r'\bspeed=(?:(10Gbps|1Gbps|100Mbps|25Gbps)\b|(10G-baseCR)\b(?!-))', re.ASCII)
+# Copper speeds that are invalid on optical ports, with their optical replacement
+_OPTICAL_SPEED_FOR_COPPER = {
+    '1G-baseT-full': '10G-baseSR-LR',
+    '100M-baseT-full': '10G-baseSR-LR',
+    '1G-baseTX': '10G-baseSR-LR',
+    '1Gbps': '10Gbps',
+    '100Mbps': '10Gbps',
+}
+_COPPER_SPEED_RE = re.compile(r'\bspeed=(1G-baseT-full|100M-baseT-full|1G-baseTX|1Gbps|100Mbps)\b', re.ASCII)
+_DEFAULT_NAME_RE = re.compile(r'default-name=([^\s\]]+)')
+
+
 def detect_routeros_version(config_text):
     """
     Detect RouterOS version from configuration syntax
@@ -5637,7 +5711,8 @@ def normalize_config(config_text: str) -> str:
     current = None
     for ln in lines:
         if ln.startswith('/'):
-            current = ln.split(' ', 2)[0] + ('' if ' ' not in ln else ' ' + ln.split(' ', 2)[1])
+            # First two words of the header, from a single split
+            current = ' '.join(ln.split(' ', 2)[:2])
             # normalize known multi-word headers
             if ln.startswith('/ip firewall address-list'):
                 current = '/ip firewall address-list'
@@ -6403,10 +6478,11 @@ def translate_config():
                 'parameter_style': 'unknown'
             }
             
-            # Detect version from multiple patterns
-            if 'by RouterOS 6.' in config or 'RouterOS 6.' in config:
+            # Detect version from multiple patterns ('RouterOS 6.' also covers the
+            # 'by RouterOS 6.' export header, so one scan per version is enough)
+            if 'RouterOS 6.' in config:
                 syntax_info['version'] = '6.x'
-            elif 'by RouterOS 7.' in config or 'RouterOS 7.' in config or 'interface-template' in config:
+            elif 'RouterOS 7.' in config or 'interface-template' in config:
                 syntax_info['version'] = '7.x'
             
             # Detect BGP syntax
@@ -6481,10 +6557,10 @@ def translate_config():
             text = config or ''
 
             def _ports_list(specs):
-                ports = []
-                for group in specs.get('ports', {}).values():
-                    ports.extend(group)
-                return ports
+                model_key = specs.get('model')
+                if model_key in _ROUTERBOARD_PORTS:
+                    return list(_ROUTERBOARD_PORTS[model_key])
+                return [port for group in specs.get('ports', {}).values() for port in group]
 
             def _normalize(s: str) -> str:
                 return re.sub(r'[^a-z0-9]+', '', (s or '').lower())
@@ -6595,14 +6671,13 @@ def translate_config():
                 }
 
             # Fallback: interface-pattern scoring across all known models.
-            iface_pattern = r"\b(ether\d+|sfp\d+(?:-\d+)?|sfp-sfpplus\d+|sfp28-\d+|qsfp28-\d+-\d+|qsfpplus\d+-\d+|qsfp\d+(?:-\d+)?|combo\d+)\b"
-            found_ifaces = set(re.findall(iface_pattern, text))
+            found_ifaces = set(_PHYSICAL_PORT_RE.findall(text))
             if found_ifaces:
                 best = None
                 best_score = -1
                 best_ports = -1
                 for model_key, specs in ROUTERBOARD_INTERFACES.items():
-                    ports = set(_ports_list(specs))
+                    ports = _device_port_set(model_key)
                     score = len(found_ifaces & ports)
                     if score > best_score or (score == best_score and specs.get('total_ports', 0) > best_ports):
                         best_score = score
@@ -6621,10 +6696,10 @@ def translate_config():
         def get_target_device_info(target_device):
             """Get target device information dynamically"""
             def ports_list(specs):
-                ports = []
-                for group in specs.get('ports', {}).values():
-                    ports.extend(group)
-                return ports
+                model_key = specs.get('model')
+                if model_key in _ROUTERBOARD_PORTS:
+                    return list(_ROUTERBOARD_PORTS[model_key])
+                return [port for group in specs.get('ports', {}).values() for port in group]
 
             aliases = {
                 'ccr1036': 'CCR1036-12G-4S',
@@ -6976,19 +7051,11 @@ Port Roles:
             
             if major == 7 and minor < 16:
                 # For 7.11.2 and earlier: Convert new format to old format
-                text = re.sub(r'\bspeed=10G-baseSR-LR\b', 'speed=10Gbps', text)
-                text = re.sub(r'\bspeed=10G-baseCR\b', 'speed=10Gbps', text)
-                text = re.sub(r'\bspeed=1G-baseT-full\b', 'speed=1Gbps', text)
-                text = re.sub(r'\bspeed=100M-baseT-full\b', 'speed=100Mbps', text)
-                text = re.sub(r'\bspeed=25G-baseR\b', 'speed=25Gbps', text)
+                text = _LEGACY_SPEED_RE.sub(lambda m: 'speed=' + _LEGACY_SPEED_NAMES[m.group(1)], text)
                 print(f"[FIRMWARE] RouterOS {target_version} uses legacy speed format (XGbps)")
             elif major == 7 and minor >= 16:
                 # For 7.16+: Convert old format to new format (negative lookahead to prevent double-suffix)
-                text = re.sub(r'\bspeed=10Gbps\b', 'speed=10G-baseSR-LR', text)
-                text = re.sub(r'\bspeed=10G-baseCR\b(?!-)', 'speed=10G-baseSR-LR', text)
-                text = re.sub(r'\bspeed=1Gbps\b', 'speed=1G-baseT-full', text)
-                text = re.sub(r'\bspeed=100Mbps\b', 'speed=100M-baseT-full', text)
-                text = re.sub(r'\bspeed=25Gbps\b', 'speed=25G-baseR', text)
+                text = _MODERN_SPEED_RE.sub(lambda m: 'speed=' + _MODERN_SPEED_NAMES[m.group(1) or m.group(2)], text)
                 print(f"[FIRMWARE] RouterOS {target_version} uses new speed format (XG-baseX)")
 
 
@@ -7171,10 +7238,11 @@ Port Roles:
                     # Remove header and add lines
                     text = re.sub(r"(?m)^/routing bgp network\s*$\n?", "", text)
                     text = re.sub(r"(?m)^/routing bgp network\s+add\b[^\n]*\n?", "", text)
-                    # Ensure address-list exists for each network
-                    for net in nets:
-                        if not re.search(rf"(?m)^/ip firewall address-list\s+add\s+address={re.escape(net)}\s+list=bgp-networks\b", text):
-                            text += f"\n/ip firewall address-list add address={net} list=bgp-networks"
+                    # Ensure address-list exists for each network: collect the
+                    # existing entries in one scan instead of searching per network
+                    listed = set(re.findall(r"(?m)^/ip firewall address-list\s+add\s+address=(\S+)\s+list=bgp-networks\b", text))
+                    for net in nets - listed:
+                        text += f"\n/ip firewall address-list add address={net} list=bgp-networks"
 
             # --- OSPF normalizations ---
             # Fix accidental slash-separated hierarchy to spaced hierarchy
@@ -7836,12 +7904,15 @@ Port Roles:
             CRITICAL: This is SYNTAX translation, not infrastructure redesign.
             """
             # STEP 0: Determine if mapping is needed based on device port differences
+            # One classification pass per inventory feeds the ethernet checks and counts
+            source_port_types = Counter(map(get_interface_type, source_ports or ()))
+            target_port_types = Counter(map(get_interface_type, target_ports or ()))
             source_has_sfp28 = any('sfp28-' in p for p in source_ports) or bool(re.search(r'\bsfp28-\d+', text))
             target_has_sfp28 = any('sfp28-' in p for p in target_ports)
             source_has_sfp_sfpplus = any('sfp-sfpplus' in p for p in source_ports) or bool(re.search(r'\bsfp-sfpplus\d+', text))
             target_has_sfp_sfpplus = any('sfp-sfpplus' in p for p in target_ports)
-            source_has_ethernet = any(p.startswith('ether') for p in source_ports) or bool(re.search(r'\bether\d+', text))
-            target_has_ethernet = any(p.startswith('ether') for p in target_ports)
+            source_has_ethernet = source_port_types['ethernet_1g'] > 0 or bool(re.search(r'\bether\d+', text))
+            target_has_ethernet = target_port_types['ethernet_1g'] > 0
 
             # Normalize legacy combo port naming (RB1009 exports often use combo1)
             if re.search(r'\bcombo\d+\b', text):
@@ -7852,8 +7923,10 @@ Port Roles:
                 elif target_ports and any(p.startswith('sfp') and not p.startswith('sfp-sfpplus') for p in target_ports):
                     text = re.sub(r'\bcombo1\b', 'sfp1', text)
             
-            source_ether_count = len([p for p in source_ports if p.startswith('ether')]) if source_ports else 0
-            target_ether_count = len([p for p in target_ports if p.startswith('ether')]) if target_ports else 0
+            source_ether_count = source_port_types['ethernet_1g']
+            target_ether_count = target_port_types['ethernet_1g']
+            # Per-class views of the target inventory, reused by the mapping passes below
+            target_qsfp_ports = [p for p in target_ports if p.startswith('qsfp')] if target_ports else []
             
             # CRITICAL: Determine if mapping is REQUIRED
             mapping_required = False
@@ -8175,7 +8248,7 @@ Port Roles:
                                 policy_mapping[iface] = dst
                                 print(f"[NX POLICY] {iface} → {dst} (BACKHAUL/uplink)")
                             else:
-                                for qp in [p for p in target_ports if p.startswith('qsfp')]:
+                                for qp in target_qsfp_ports:
                                     if qp not in used_tgt:
                                         used_tgt.add(qp)
                                         policy_mapping[iface] = qp
@@ -8189,7 +8262,7 @@ Port Roles:
                                 policy_mapping[iface] = dst
                                 print(f"[NX POLICY] {iface} → {dst} (OLT LAG)")
                             else:
-                                for qp in [p for p in target_ports if p.startswith('qsfp')]:
+                                for qp in target_qsfp_ports:
                                     if qp not in used_tgt:
                                         used_tgt.add(qp)
                                         policy_mapping[iface] = qp
@@ -8218,7 +8291,7 @@ Port Roles:
                                     print(f"[NX POLICY] {iface} → {dst} ({role_key.upper()})")
                                 else:
                                     # QSFP overflow — don't strand ports with IPs
-                                    for qp in [p for p in target_ports if p.startswith('qsfp')]:
+                                    for qp in target_qsfp_ports:
                                         if qp not in used_tgt:
                                             used_tgt.add(qp)
                                             policy_mapping[iface] = qp
@@ -8248,7 +8321,7 @@ Port Roles:
                                 policy_mapping[iface] = dst
                                 print(f"[NX POLICY] {iface} → {dst} (BACKHAUL)")
                             else:
-                                for qp in [p for p in target_ports if p.startswith('qsfp')]:
+                                for qp in target_qsfp_ports:
                                     if qp not in used_tgt:
                                         used_tgt.add(qp)
                                         policy_mapping[iface] = qp
@@ -8263,7 +8336,7 @@ Port Roles:
                                 print(f"[NX POLICY] {iface} → {dst} (LTE)")
                             else:
                                 # QSFP overflow — LTE ports must not be stranded
-                                for qp in [p for p in target_ports if p.startswith('qsfp')]:
+                                for qp in target_qsfp_ports:
                                     if qp not in used_tgt:
                                         used_tgt.add(qp)
                                         policy_mapping[iface] = qp
@@ -8278,7 +8351,7 @@ Port Roles:
                                 print(f"[NX POLICY] {iface} → {dst} (TARANA)")
                             else:
                                 # QSFP overflow — Tarana ports must not be stranded
-                                for qp in [p for p in target_ports if p.startswith('qsfp')]:
+                                for qp in target_qsfp_ports:
                                     if qp not in used_tgt:
                                         used_tgt.add(qp)
                                         policy_mapping[iface] = qp
@@ -8293,7 +8366,7 @@ Port Roles:
                                 print(f"[NX POLICY] {iface} → {dst} (unknown role)")
                             else:
                                 # QSFP overflow for excess ports
-                                for qp in [p for p in target_ports if p.startswith('qsfp')]:
+                                for qp in target_qsfp_ports:
                                     if qp not in used_tgt:
                                         used_tgt.add(qp)
                                         policy_mapping[iface] = qp
@@ -8308,7 +8381,7 @@ Port Roles:
                         text = _apply_mapping_everywhere(text, policy_mapping)
 
                     # Strip qsfp* interface lines if target has no QSFP ports
-                    target_has_qsfp = any(p.startswith('qsfp') for p in (target_ports or []))
+                    target_has_qsfp = bool(target_qsfp_ports)
                     if not target_has_qsfp:
                         text = re.sub(r"(?m)^\s*set\s+\[\s*find\s+default-name=qsfp[^\]]+\][^\n]*\n?", "", text)
 
@@ -8317,10 +8390,10 @@ Port Roles:
                     # unmapped. Comment out lines that reference non-existent
                     # target ports to prevent config errors.
                     valid_ports = set(target_ports or []) | {'loop0'}
-                    _dangling_ifaces = set()
-                    for _di in re.findall(r'\b(ether\d+|sfp28-\d+|sfp-sfpplus\d+|sfp(?!28)(?!-sfpplus)\d+|combo\d+)\b', text):
-                        if _di not in valid_ports:
-                            _dangling_ifaces.add(_di)
+                    _dangling_ifaces = {
+                        _di for _di in re.findall(r'\b(ether\d+|sfp28-\d+|sfp-sfpplus\d+|sfp(?!28)(?!-sfpplus)\d+|combo\d+)\b', text)
+                        if _di not in valid_ports
+                    }
                     if _dangling_ifaces:
                         print(f"[PORT EXHAUSTION] {len(_dangling_ifaces)} unmapped ports remain: {sorted(_dangling_ifaces)[:5]}")
                         # Comment-out /interface ethernet set lines for dangling ports
@@ -8406,19 +8479,17 @@ Port Roles:
                 # Default: unknown (will be mapped sequentially)
                 return 'unknown'
             
-            # Classify all interfaces
+            # Classify all interfaces; the log lines go out in one flushed write
+            classify_log = []
             for iface, info in interface_info.items():
                 info['purpose'] = classify_interface_purpose(info['comment'], iface)
-                print(f"[INTERFACE CLASSIFY] {iface}: '{info['comment']}' → {info['purpose']}")
+                classify_log.append(f"[INTERFACE CLASSIFY] {iface}: '{info['comment']}' → {info['purpose']}")
+            if classify_log:
+                print('\n'.join(classify_log))
             
             # Gather ALL used interface tokens in order of appearance (more comprehensive pattern)
-            used = []
             # Match all interface patterns: etherN, sfpN, sfp-sfpplusN, sfp28-N, etc.
-            interface_pattern = r"\b(ether\d+|sfp\d+(?:-\d+)?|sfp-sfpplus\d+|sfp28-\d+|qsfp28-\d+-\d+|qsfpplus\d+-\d+|qsfp\d+(?:-\d+)?|combo\d+)\b"
-            for m in re.finditer(interface_pattern, text):
-                name = m.group(1)
-                if name not in used:
-                    used.append(name)
+            used = list(dict.fromkeys(_PHYSICAL_PORT_RE.findall(text)))
             
             print(f"[INTERFACE MAPPING] Found {len(used)} unique interfaces in config: {', '.join(used[:10])}{'...' if len(used) > 10 else ''}")
             
@@ -8482,17 +8553,27 @@ Port Roles:
             # QSFP ports available as last-resort overflow when SFP28 pool exhausted
             qsfp_overflow = [p for p in target_ports if p.startswith('qsfp') and p != mgmt_port]
             
-            def _assign_next_available(pool):
-                """Find next available port from pool that's not already assigned."""
-                for p in pool:
-                    if p not in used_targets:
-                        return p
-                # Fallback: try QSFP overflow ports
-                for p in qsfp_overflow:
-                    if p not in used_targets:
-                        return p
+            # used_targets only ever grows, so a port skipped once stays taken;
+            # each pool keeps a cursor past its taken prefix instead of rescanning.
+            pool_cursors = {}
+            
+            def _next_free(pool_name, pool):
+                start = pool_cursors.get(pool_name, 0)
+                for idx in range(start, len(pool)):
+                    if pool[idx] not in used_targets:
+                        pool_cursors[pool_name] = idx
+                        return pool[idx]
+                pool_cursors[pool_name] = len(pool)
                 return None
             
+            def _assign_next_available(role):
+                """Find next available port from the role's pool that's not already assigned."""
+                dst = _next_free(role, policy_ports[role])
+                if dst is None:
+                    # Fallback: try QSFP overflow ports
+                    dst = _next_free('qsfp_overflow', qsfp_overflow)
+                return dst
+            
             # Sort used interfaces to ensure consistent mapping (ether ports first, then SFP ports)
             def interface_sort_key(iface):
                 if iface.startswith('ether'):
@@ -8535,7 +8616,7 @@ Port Roles:
             priority_order.sort(key=lambda x: (x[0], interface_sort_key(x[1])))
             sorted_used = [src for _, src in priority_order]
 
-            target_has_qsfp = any(p.startswith('qsfp') for p in (target_ports or []))
+            target_has_qsfp = bool(target_qsfp_ports)
             
             for src in sorted_used:
                 # Skip if interface is already in target format (already correct)
@@ -8545,7 +8626,7 @@ Port Roles:
                     continue
                 
                 # Skip management port mapping unless target device has only 1 ethernet port (like CCR2004, CCR2216)
-                should_skip_mgmt = (src == mgmt_port and len([p for p in target_ports if p.startswith('ether')]) > 1)
+                should_skip_mgmt = (src == mgmt_port and target_ether_count > 1)
                 if should_skip_mgmt:
                     print(f"[INTERFACE MAPPING] Skipping management port {src} (target has multiple ethernet ports)")
                     continue
@@ -8584,7 +8665,7 @@ Port Roles:
                 
                 # Map based on purpose according to policy
                 if purpose == 'backhaul':
-                    dst = _assign_next_available(policy_ports['backhaul'])
+                    dst = _assign_next_available('backhaul')
                     if dst:
                         mapping[src] = dst
                         used_targets.add(dst)
@@ -8592,7 +8673,7 @@ Port Roles:
                     continue
                 
                 elif purpose == 'olt':
-                    dst = _assign_next_available(policy_ports['olt'])
+                    dst = _assign_next_available('olt')
                     if dst:
                         mapping[src] = dst
                         used_targets.add(dst)
@@ -8600,7 +8681,7 @@ Port Roles:
                     continue
                 
                 elif purpose == 'switch':
-                    dst = _assign_next_available(policy_ports['switch'])
+                    dst = _assign_next_available('switch')
                     if dst:
                         mapping[src] = dst
                         used_targets.add(dst)
@@ -8608,7 +8689,7 @@ Port Roles:
                     continue
                 
                 elif purpose == 'lte':
-                    dst = _assign_next_available(policy_ports['lte'])
+                    dst = _assign_next_available('lte')
                     if dst:
                         mapping[src] = dst
                         used_targets.add(dst)
@@ -8616,7 +8697,7 @@ Port Roles:
                     continue
                 
                 elif purpose == 'tarana':
-                    dst = _assign_next_available(policy_ports['tarana'])
+                    dst = _assign_next_available('tarana')
                     if dst:
                         mapping[src] = dst
                         used_targets.add(dst)
@@ -8645,7 +8726,7 @@ Port Roles:
                                     dst = candidate
                             # If preferred offset slot is taken, find next available
                             if not dst:
-                                dst = _assign_next_available(policy_ports['unknown'])
+                                dst = _assign_next_available('unknown')
                             if dst:
                                 mapping[src] = dst
                                 used_targets.add(dst)
@@ -8653,7 +8734,7 @@ Port Roles:
                             continue
                 
                 # Legacy SFP ports or unknown: map to next available target port
-                dst = _assign_next_available(policy_ports['unknown'])
+                dst = _assign_next_available('unknown')
                 if dst:
                     mapping[src] = dst
                     used_targets.add(dst)
@@ -8731,7 +8812,7 @@ Port Roles:
 
             # If target doesn't have QSFP ports, strip qsfp* interface lines (common on CCR2216 exports).
             # This prevents invalid ports from remaining after a downgrade/migration.
-            target_has_qsfp = any(p.startswith('qsfp') for p in (target_ports or []))
+            target_has_qsfp = bool(target_qsfp_ports)
             if not target_has_qsfp:
                 text = re.sub(r"(?m)^\s*set\s+\[\s*find\s+default-name=qsfp[^\]]+\][^\n]*\n?", "", text)
             
@@ -9097,25 +9178,15 @@ Port Roles:
                         in_eth_section = (stripped == '/interface ethernet')
                         result.append(line)
                         continue
-                    if in_eth_section:
-                        dm = re.search(r'default-name=([^\s\]]+)', line)
+                    if in_eth_section and 'speed=' in line:
+                        dm = _DEFAULT_NAME_RE.search(line)
                         port_name = dm.group(1) if dm else None
                         if port_name and port_name in optical_ports:
-                            # Replace copper-only speeds with optical speeds
-                            if 'baseT' in line or 'baseTX' in line:
-                                orig = line
-                                line = re.sub(r'\bspeed=1G-baseT-full\b', 'speed=10G-baseSR-LR', line)
-                                line = re.sub(r'\bspeed=100M-baseT-full\b', 'speed=10G-baseSR-LR', line)
-                                line = re.sub(r'\bspeed=1G-baseTX\b', 'speed=10G-baseSR-LR', line)
-                                if line != orig:
-                                    fixed_count += 1
-                            # Also fix legacy copper formats on optical ports
-                            if re.search(r'\bspeed=1Gbps\b', line):
-                                line = re.sub(r'\bspeed=1Gbps\b', 'speed=10Gbps', line)
-                                fixed_count += 1
-                            if re.search(r'\bspeed=100Mbps\b', line):
-                                line = re.sub(r'\bspeed=100Mbps\b', 'speed=10Gbps', line)
-                                fixed_count += 1
+                            # Replace copper-only speeds (new and legacy formats) with optical speeds
+                            line, n = _COPPER_SPEED_RE.subn(
+                                lambda m: 'speed=' + _OPTICAL_SPEED_FOR_COPPER[m.group(1)], line
+                            )
+                            fixed_count += n
                     result.append(line)
                 if fixed_count:
                     print(f"[SPEED] Adjusted {fixed_count} copper speeds to optical for SFP28/SFP+ ports")
@@ -9130,6 +9201,7 @@ Port Roles:
                 result = []
                 prev = None
                 removed = 0
+                set_default_name_re = re.compile(r'set\s+\[\s*find\s+default-name=(\S+)\s*\]')
 
                 # Pass 1: remove consecutive exact duplicates
                 deduped_consecutive = []
@@ -9142,26 +9214,23 @@ Port Roles:
                     prev = s
 
                 # Pass 2: for /interface ethernet set lines, keep only last occurrence
-                # of each default-name= to avoid conflicting duplicate entries
+                # of each default-name= to avoid conflicting duplicate entries.
+                # Each line is matched once; the names are reused for the filter.
+                set_names = []
                 iface_last_idx = {}  # default-name -> last index in deduped_consecutive
                 for i, line in enumerate(deduped_consecutive):
-                    s = line.strip()
-                    m = re.search(r'set\s+\[\s*find\s+default-name=(\S+)\s*\]', s)
-                    if m:
-                        iface_last_idx[m.group(1)] = i
+                    m = set_default_name_re.search(line)
+                    name = m.group(1) if m else None
+                    set_names.append(name)
+                    if name is not None:
+                        iface_last_idx[name] = i
 
-                iface_seen = {}  # default-name -> count of occurrences seen so far
                 iface_removed = 0
-                for i, line in enumerate(deduped_consecutive):
-                    s = line.strip()
-                    m = re.search(r'set\s+\[\s*find\s+default-name=(\S+)\s*\]', s)
-                    if m:
-                        name = m.group(1)
-                        iface_seen[name] = iface_seen.get(name, 0) + 1
-                        # If this isn't the last occurrence, skip it
-                        if i != iface_last_idx.get(name):
-                            iface_removed += 1
-                            continue
+                for i, (line, name) in enumerate(zip(deduped_consecutive, set_names)):
+                    # If this isn't the last occurrence, skip it
+                    if name is not None and i != iface_last_idx[name]:
+                        iface_removed += 1
+                        continue
                     result.append(line)
 
                 if removed:
@@ -9212,11 +9281,12 @@ Port Roles:
                     skip_line = False
                     continue
                 
+                stripped = line.strip()
                 # Track section headers (lines starting with /)
-                if line.strip().startswith('/') and not line.strip().startswith('//'):
+                if stripped.startswith('/') and not stripped.startswith('//'):
                     # Check if this is a section header (not a command embedded in text)
                     if re.match(r'^/[a-z]', line):
-                        current_section = line.strip()
+                        current_section = stripped
                         cleaned.append(line)
                         continue
                 
@@ -9228,10 +9298,10 @@ Port Roles:
                         continue
                 
                 # Remove duplicate BGP template headers (keep only first)
-                if line.strip() == '/routing bgp template' and bgp_template_set is not None:
+                if stripped == '/routing bgp template' and bgp_template_set is not None:
                     print(f"[FINAL CLEANUP] Removing duplicate BGP template header at line {i}")
                     continue
-                elif line.strip() == '/routing bgp template':
+                elif stripped == '/routing bgp template':
                     bgp_template_set = True
                 
                 # Remove firewall rules that are mixed in BGP template section
@@ -9241,7 +9311,7 @@ Port Roles:
                         continue
                 
                 # Fix empty OSPF area section
-                if line.strip() == '/routing ospf area':
+                if stripped == '/routing ospf area':
                     cleaned.append(line)
                     # Check if next line is an add command
                     if i + 1 < len(lines):
@@ -9342,9 +9412,7 @@ Port Roles:
                 return text
 
             # Collect used interface references to pick an unused destination port.
-            used = set()
-            for m in re.finditer(r'(?i)(?:^|\s)(?:interface|interfaces|in-interface|out-interface)=([A-Za-z0-9._-]+)', text):
-                used.add(m.group(1))
+            used = set(re.findall(r'(?i)(?:^|\s)(?:interface|interfaces|in-interface|out-interface)=([A-Za-z0-9._-]+)', text))
 
             def _looks_mgmt_comment(c: str) -> bool:
                 c = (c or '').lower()
@@ -9359,7 +9427,9 @@ Port Roles:
             # Detect non-mgmt usage on ether1.
             non_mgmt_ip_on_ether1 = False
             ether1_comment = None
-            for line in text.splitlines():
+            # Split once; the detection scan and the rewrite below share the lines
+            lines = text.splitlines()
+            for line in lines:
                 if re.search(r'\bdefault-name=ether1\b', line) and 'comment=' in line:
                     cm = re.search(r'\bcomment=([^\s]+|"[^"]*")', line)
                     if cm:
@@ -9387,13 +9457,14 @@ Port Roles:
             dest = next((p for p in candidates if p not in used), candidates[0])
 
             # Two-pass update for /interface ethernet lines so we can copy comments and un-disable dest.
-            lines = text.splitlines()
             in_eth = False
             saw_dest_set = False
 
             def _strip_disabled_yes(s: str) -> str:
                 return re.sub(r'\s+disabled\s*=\s*yes\b', '', s, flags=re.IGNORECASE)
 
+            # dest is fixed for the whole pass, so its pattern is built once
+            dest_default_name_re = re.compile(rf'\bdefault-name={re.escape(dest)}\b')
             out = []
             for line in lines:
                 stripped = line.strip()
@@ -9401,8 +9472,11 @@ Port Roles:
                     in_eth = (stripped == '/interface ethernet')
                     out.append(line)
                     continue
+                if not in_eth:
+                    out.append(line)
+                    continue
 
-                if in_eth and re.search(r'\bdefault-name=ether1\b', line):
+                if re.search(r'\bdefault-name=ether1\b', line):
                     # Ensure ether1 is labeled as Management.
                     if 'comment=' in line and not _looks_mgmt_comment(ether1_comment or ''):
                         line = re.sub(r'\bcomment=([^\s]+|"[^"]*")', 'comment="Management"', line)
@@ -9411,7 +9485,7 @@ Port Roles:
                     out.append(line)
                     continue
 
-                if in_eth and re.search(rf'\bdefault-name={re.escape(dest)}\b', line):
+                if dest_default_name_re.search(line):
                     saw_dest_set = True
                     line = _strip_disabled_yes(line)
                     if ether1_comment and not _looks_mgmt_comment(ether1_comment):
@@ -9558,7 +9632,7 @@ Port Roles:
                     if not in_eth:
                         continue
                     m_iface = re.search(r'default-name=([^\s\]]+)', line)
-                    m_comment = re.search(r'comment=([^\s\n"]+|"[^"]+")', line)
+                    m_comment = _COMMENT_VALUE_RE.search(line)
                     if not m_iface or not m_comment:
                         continue
                     iface = m_iface.group(1).strip()
@@ -9602,7 +9676,7 @@ Port Roles:
                 if not in_ip:
                     continue
                 m_iface = re.search(r'interface=([^\s]+)', line)
-                m_comment = re.search(r'comment=([^\s\n"]+|"[^"]+")', line)
+                m_comment = _COMMENT_VALUE_RE.search(line)
                 if not m_iface or not m_comment:
                     continue
                 iface = m_iface.group(1).strip()
@@ -9623,7 +9697,7 @@ Port Roles:
                 if not in_ip_src:
                     continue
                 m_iface = re.search(r'interface=([^\s]+)', line)
-                m_comment = re.search(r'comment=([^\s\n"]+|"[^"]+")', line)
+                m_comment = _COMMENT_VALUE_RE.search(line)
                 if not m_iface or not m_comment:
                     continue
                 iface = m_iface.group(1).strip()
@@ -9646,10 +9720,9 @@ Port Roles:
                 return text
 
             # Collect interface tokens used in the config (ordered by appearance).
-            iface_pattern = r"\b(ether\d+|sfp\d+(?:-\d+)?|sfp-sfpplus\d+|sfp28-\d+|qsfp28-\d+-\d+|qsfpplus\d+-\d+|qsfp\d+(?:-\d+)?|combo\d+)\b"
             seen = set()
             used = []
-            for m in re.finditer(iface_pattern, text):
+            for m in _PHYSICAL_PORT_RE.finditer(text):
                 name = m.group(1)
                 if name not in seen:
                     seen.add(name)
@@ -9708,7 +9781,7 @@ Port Roles:
                     iface_scan = m_scan.group(2)
                     if iface_scan == mgmt:
                         continue
-                    cm_scan = re.search(r'comment=([^\s\n"]+|"[^"]+")', line)
+                    cm_scan = _COMMENT_VALUE_RE.search(line)
                     comment_scan = cm_scan.group(1).strip().strip('"') if cm_scan else ''
                     purpose_scan = _classify_interface_purpose(comment_scan, iface_scan)
                     if purpose_scan == 'backhaul':
@@ -9785,7 +9858,7 @@ Port Roles:
                                 out_lines.append(line)
                                 continue
                             # extract comment to classify
-                            cm = re.search(r'comment=([^\s\n"]+|"[^"]+")', line)
+                            cm = _COMMENT_VALUE_RE.search(line)
                             comment = cm.group(1).strip().strip('"') if cm else ''
                             if not comment and iface in ip_comment_map:
                                 comment = ip_comment_map.get(iface, '')
@@ -9828,7 +9901,7 @@ Port Roles:
                 # Add fallback mappings for any remaining invalid interfaces (e.g., bridge ports)
                 used_updated = []
                 seen_updated = set()
-                for m in re.finditer(iface_pattern, text):
+                for m in _PHYSICAL_PORT_RE.finditer(text):
                     name = m.group(1)
                     if name not in seen_updated:
                         seen_updated.add(name)
@@ -9867,7 +9940,7 @@ Port Roles:
                         cleaned.append(line)
                         continue
                     iface = m.group(2)
-                    cm = re.search(r'comment=([^\s\n"]+|"[^"]+")', line)
+                    cm = _COMMENT_VALUE_RE.search(line)
                     comment = cm.group(1).strip().strip('"') if cm else ''
                     if 'MANAGEMENT' in (comment or '').upper() and iface != mgmt:
                         # Move management label to ether1
@@ -9878,7 +9951,7 @@ Port Roles:
                             continue
                         mgmt_written = True
                         if 'comment=' in line:
-                            line = re.sub(r'comment=([^\s\n"]+|"[^"]+")', 'comment="Management"', line)
+                            line = _COMMENT_VALUE_RE.sub('comment="Management"', line)
                         else:
                             line = line.rstrip() + ' comment="Management"'
                     else:
@@ -9996,7 +10069,7 @@ Port Roles:
             for line in text.splitlines():
                 if 'interface=' in line or 'interfaces=' in line:
                     # Prefer comment-driven correction when present
-                    cm = re.search(r'comment=([^\s\n"]+|"[^"]+")', line)
+                    cm = _COMMENT_VALUE_RE.search(line)
                     if cm:
                         ckey = _normalize_comment_key(cm.group(1).strip().strip('"'))
                         mapped_iface = _find_best_comment_iface(ckey)
@@ -16419,9 +16492,9 @@ def _parse_mikrotik_for_nokia(config_text: str) -> dict:
 
     # ── Detect ROS version / syntax (inline — same logic as detect_routeros_syntax) ──
     syntax_info = {'version': 'unknown', 'bgp_syntax': 'unknown', 'ospf_syntax': 'unknown'}
-    if 'by RouterOS 6.' in text or 'RouterOS 6.' in text:
+    if 'RouterOS 6.' in text:
         syntax_info['version'] = '6.x'
-    elif 'by RouterOS 7.' in text or 'RouterOS 7.' in text or 'interface-template' in text:
+    elif 'RouterOS 7.' in text or 'interface-template' in text:
         syntax_info['version'] = '7.x'
     if '/routing bgp peer' in text:
         syntax_info['bgp_syntax'] = 'peer'
@@ -18504,7 +18577,7 @@ def _ido_target_allowed(target_path: str) -> bool:
     path = "/" + str(target_path or "").lstrip("/")
     if path.startswith("/api/sites"):
         return False
-    return any(path.startswith(prefix) for prefix in IDO_PROXY_ALLOWED_PREFIXES)
+    return path.startswith(IDO_PROXY_ALLOWED_PREFIXES)
 
 
 def _ido_to_bool(value, default=False):
@@ -20002,8 +20075,8 @@ def migrate_config():
             'complexity': {
                 'ip_addresses': len(re.findall(r'\b(?:\d{1,3}\.){3}\d{1,3}(?:/\d{1,2})?\b', config)),
                 'bridges': len(re.findall(r'/interface bridge\s', config)),
-                'vpls_tunnels': len(re.findall(r'/interface vpls', config)),
-                'firewall_sections': len(re.findall(r'/ip firewall', config)),
+                'vpls_tunnels': config.count('/interface vpls'),
+                'firewall_sections': config.count('/ip firewall'),
                 'ospf': '/routing ospf' in config,
                 'bgp': '/routing bgp' in config,
                 'mpls': '/mpls' in config or '/interface vpls' in config,
@@ -20791,8 +20864,8 @@ def validate_email_domain(email):
     allowed_raw = os.getenv('ALLOWED_EMAIL_DOMAINS', '@team.nxlink.com')
     if allowed_raw.strip() == '*':
         return True
-    allowed = [d.strip().lower() for d in allowed_raw.split(',') if d.strip()]
-    return any(email.endswith(d) for d in allowed)
+    allowed = tuple(d.strip().lower() for d in allowed_raw.split(',') if d.strip())
+    return email.endswith(allowed)
 
 def verify_token(token):
     """Verify JWT token and return user info"""
@@ -28144,11 +28217,12 @@ def bulk_migration_analyze():
         # Step 6: Count significant config elements
         ip_count = len(re.findall(r'\b(?:\d{1,3}\.){3}\d{1,3}(?:/\d{1,2})?\b', config_text))
         bridge_count = len(re.findall(r'/interface bridge\s', config_text))
-        vpls_count = len(re.findall(r'/interface vpls', config_text))
-        firewall_count = len(re.findall(r'/ip firewall', config_text))
+        vpls_count = config_text.count('/interface vpls')
+        firewall_count = config_text.count('/ip firewall')
         ospf_found = '/routing ospf' in config_text
         bgp_found = '/routing bgp' in config_text
         mpls_found = '/mpls' in config_text or '/interface vpls' in config_text
+        config_lines = config_text.splitlines()
 
         return {
             'host': host_ip,
@@ -28168,9 +28242,9 @@ def bulk_migration_analyze():
             'policy_summary': policy_summary,
             'manual_review_required': manual_review_required,
             'warnings': migration_warnings,
-            'config_lines': len(config_text.splitlines()),
+            'config_lines': len(config_lines),
             'config_text': config_text,
-            'config_preview': '\n'.join(config_text.splitlines()[:15]),
+            'config_preview': '\n'.join(config_lines[:15]),
             'complexity': {
                 'ip_addresses': ip_count,
                 'bridges': bridge_count,
@@ -84,13 +84,16 @@ def _resolve_template_path() -> Path:
     return _default_template_path()
 
 
+# Loopback address candidates, most specific first
+LOOPBACK_IP_PATTERNS = (
+    re.compile(r"/ip\s+address\s+add\s+address=(\d+\.\d+\.\d+\.\d+)(?:/\d+)?[^\n]*\binterface=loop0\b", re.IGNORECASE),
+    re.compile(r"/ip\s+address\s+add\s+address=(\d+\.\d+\.\d+\.\d+)/(?:\d+)", re.IGNORECASE),
+)
+
+
 def extract_loopback_ip(config_text: str) -> str | None:
-    patterns = [
-        r"/ip\s+address\s+add\s+address=(\d+\.\d+\.\d+\.\d+)(?:/\d+)?[^\n]*\binterface=loop0\b",
-        r"/ip\s+address\s+add\s+address=(\d+\.\d+\.\d+\.\d+)/(?:\d+)",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, config_text, re.IGNORECASE)
+    for pattern in LOOPBACK_IP_PATTERNS:
+        match = pattern.search(config_text)
         if match:
             return match.group(1)
     return None
@@ -207,8 +210,8 @@ def apply_engineering_compliance(config_text: str, loopback_ip: str | None = Non
         out: list[str] = []
         for line in text.splitlines():
             normalized = line.strip()
-            lower = normalized.lower()
-            if normalized and any(lower.startswith(prefix) for prefix in SAFE_DEDUPE_PREFIXES):
+            # Every safe prefix is a "/..." command, so only those lines are lowercased
+            if normalized.startswith("/") and normalized.lower().startswith(SAFE_DEDUPE_PREFIXES):
                 if normalized in seen:
                     continue
                 seen.add(normalized)
@@ -758,7 +758,7 @@ def _ido_target_allowed(target_path: str) -> bool:
     path = "/" + target_path.lstrip("/")
     if path.startswith("/api/sites"):
         return False
-    return any(path.startswith(prefix) for prefix in IDO_PROXY_ALLOWED_PREFIXES)
+    return path.startswith(IDO_PROXY_ALLOWED_PREFIXES)
 
 
 def _ido_to_bool(value: Any, default: bool = False) -> bool:
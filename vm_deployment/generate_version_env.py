@@ -83,7 +83,14 @@ def main() -> int:
     ]
 
     output_path = Path(args.output)
-    output_path.write_text("\n".join(env_lines) + "\n", encoding="utf-8")
+    content = "\n".join(env_lines) + "\n"
+    # Leave an identical file untouched so its mtime only moves on a real change
+    try:
+        unchanged = output_path.read_text(encoding="utf-8") == content
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        output_path.write_text(content, encoding="utf-8")
     print(f"{version} ({git_sha}) -> {output_path}")
     return 0
 
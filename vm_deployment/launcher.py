@@ -7,7 +7,11 @@ Starts both backend API and frontend server in a single executable
 import sys
 import io
 import os
+import re
+import gzip
+import logging
 import threading
+import queue
 import time
 import webbrowser
 import subprocess
@@ -21,8 +25,17 @@ if sys.platform == 'win32':
     except:
         pass  # If already wrapped or not available, continue
 
+# Launcher logger - handler is configured once here; NEXUS_LOG_LEVEL=DEBUG shows the path diagnostics
+logger = logging.getLogger('launcher')
+if not logger.handlers:
+    _log_handler = logging.StreamHandler(sys.stdout)
+    _log_handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(_log_handler)
+logger.setLevel(getattr(logging, os.getenv('NEXUS_LOG_LEVEL', 'INFO').upper(), logging.INFO))
+logger.propagate = False
+
 # Force immediate output
-print("NEXUS - Starting...", flush=True)
+logger.info("NEXUS - Starting...")
 sys.stdout.flush()
 sys.stderr.flush()
 
@@ -32,22 +45,22 @@ if getattr(sys, 'frozen', False):
     # PyInstaller extracts files to sys._MEIPASS
     BASE_DIR = Path(sys._MEIPASS)  # Temporary extraction directory
     APP_DIR = Path(sys.executable).parent  # Where .exe is located
-    print(f"[DEBUG] Running as executable", flush=True)
-    print(f"[DEBUG] BASE_DIR (extracted): {BASE_DIR}", flush=True)
-    print(f"[DEBUG] APP_DIR (exe location): {APP_DIR}", flush=True)
+    logger.debug("[DEBUG] Running as executable")
+    logger.debug(f"[DEBUG] BASE_DIR (extracted): {BASE_DIR}")
+    logger.debug(f"[DEBUG] APP_DIR (exe location): {APP_DIR}")
 else:
     # Running as script
     BASE_DIR = Path(__file__).parent
     APP_DIR = BASE_DIR
-    print(f"[DEBUG] Running as script", flush=True)
-    print(f"[DEBUG] BASE_DIR: {BASE_DIR}", flush=True)
+    logger.debug("[DEBUG] Running as script")
+    logger.debug(f"[DEBUG] BASE_DIR: {BASE_DIR}")
 
 # Change to app directory to ensure relative paths work
 try:
     os.chdir(APP_DIR)
-    print(f"[DEBUG] Changed to directory: {APP_DIR}", flush=True)
+    logger.debug(f"[DEBUG] Changed to directory: {APP_DIR}")
 except Exception as e:
-    print(f"[WARNING] Could not change directory: {e}", flush=True)
+    logger.warning(f"[WARNING] Could not change directory: {e}")
 
 # Import servers with error handling
 HAS_FLASK = False
@@ -55,23 +68,23 @@ try:
     from flask import Flask
     import flask
     HAS_FLASK = True
-    print("[IMPORT] Flask loaded successfully", flush=True)
+    logger.info("[IMPORT] Flask loaded successfully")
 except ImportError as e:
     HAS_FLASK = False
-    print(f"[ERROR] Flask not found: {e}", flush=True)
-    print("[ERROR] Please install requirements.txt", flush=True)
+    logger.error(f"[ERROR] Flask not found: {e}")
+    logger.error("[ERROR] Please install requirements.txt")
 except Exception as e:
     HAS_FLASK = False
-    print(f"[ERROR] Failed to import Flask: {e}", flush=True)
+    logger.error(f"[ERROR] Failed to import Flask: {e}")
 
 try:
     import http.server
-    import socketserver
+    import http.cookiejar
     import requests
     import socket
-    print("[IMPORT] Standard modules loaded", flush=True)
+    logger.info("[IMPORT] Standard modules loaded")
 except Exception as e:
-    print(f"[ERROR] Failed to import standard modules: {e}", flush=True)
+    logger.error(f"[ERROR] Failed to import standard modules: {e}")
     sys.exit(1)
 
 # CRITICAL: Import api_server at module level so PyInstaller can detect it
@@ -80,15 +93,15 @@ except Exception as e:
 try:
     import api_server  # NOQA: F401 - Imported for PyInstaller analysis
     API_SERVER_AVAILABLE = True
-    print("[IMPORT] api_server module detected", flush=True)
+    logger.info("[IMPORT] api_server module detected")
 except (ImportError, ModuleNotFoundError):
     # This is OK during build - PyInstaller will still include it if it sees the import
     # At runtime, we'll handle it in start_backend()
     API_SERVER_AVAILABLE = False
-    print("[IMPORT] api_server will be loaded dynamically", flush=True)
+    logger.info("[IMPORT] api_server will be loaded dynamically")
 except Exception as e:
     API_SERVER_AVAILABLE = False
-    print(f"[IMPORT] api_server import check: {e}", flush=True)
+    logger.info(f"[IMPORT] api_server import check: {e}")
 
 # Configuration
 BACKEND_PORT = 5000
@@ -96,12 +109,31 @@ FRONTEND_PORT = 8000
 BACKEND_URL = f"http://localhost:{BACKEND_PORT}"
 FRONTEND_URL = f"http://localhost:{FRONTEND_PORT}/nexus.html"
 
+# Request/response matching used per proxied request - built once instead of per call
+PROXY_SKIP_REQUEST_HEADERS = frozenset({'host', 'connection'})
+PROXY_SKIP_RESPONSE_HEADERS = frozenset({'content-encoding', 'transfer-encoding', 'connection'})
+PROXY_BODY_METHODS = frozenset({'POST', 'PUT', 'PATCH'})
+LOG_IP_RE = re.compile(r'\b(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\b')
+LOG_STATUS_RE = re.compile(r'\b(400|404|403)\b')
+
+# Shared keep-alive session for proxying to the backend instead of a new connection per call.
+# Cookies are never stored so one browser's login can't leak into another proxied request.
+proxy_session = requests.Session()
+proxy_session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
 # Global flags
 backend_process = None
+backend_thread = None
 frontend_thread = None
 backend_ready = False
 frontend_ready = False
 
+# Service threads put their name here when they exit so main() can block instead of polling ports
+stopped_services = queue.Queue()
+# Set by each service thread once its socket is bound (or it has failed) so startup waits on an event
+backend_bound = threading.Event()
+frontend_bound = threading.Event()
+
 
 def check_port(port):
     """Check if a port is available"""
@@ -115,44 +147,53 @@ def check_port(port):
         return False
 
 
-def wait_for_service(url, name, timeout=30):
-    """Wait for a service to become available"""
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        try:
-            response = requests.get(url, timeout=2)
-            if response.status_code in [200, 404]:  # 404 is OK, means server is running
-                return True
-        except:
-            pass
-        time.sleep(1)
+def build_static_response(status_line, headers, body=b''):
+    """Pre-build a complete HTTP response (status line, headers and body) as one bytes blob"""
+    head_lines = [status_line] + [f"{name}: {value}" for name, value in headers]
+    head = ('\r\n'.join(head_lines) + '\r\n\r\n').encode('latin-1')
+    return head + body, len(head)
+
+
+def accepts_gzip(accept_encoding):
+    """True when an Accept-Encoding header lists gzip without a q=0 rejection"""
+    for token in accept_encoding.split(','):
+        coding, _, params = token.partition(';')
+        if coding.strip().lower() != 'gzip':
+            continue
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
     return False
 
 
 def start_backend():
     """Start the Flask backend server"""
-    global backend_process, backend_ready
+    global backend_process, backend_thread, backend_ready
     
-    print(f"[BACKEND] ==========================================", flush=True)
-    print(f"[BACKEND] Starting API server on port {BACKEND_PORT}...", flush=True)
-    print(f"[BACKEND] ==========================================", flush=True)
-    sys.stdout.flush()
+    logger.info("[BACKEND] ==========================================")
+    logger.info(f"[BACKEND] Starting API server on port {BACKEND_PORT}...")
+    logger.info("[BACKEND] ==========================================")
     
     # Check if port is already in use
     if check_port(BACKEND_PORT):
-        print(f"[BACKEND] Port {BACKEND_PORT} is already in use", flush=True)
-        print(f"[BACKEND] Attempting to verify existing backend...", flush=True)
+        logger.info(f"[BACKEND] Port {BACKEND_PORT} is already in use")
+        logger.info("[BACKEND] Attempting to verify existing backend...")
         try:
             response = requests.get(f"{BACKEND_URL}/api/health", timeout=2)
             if response.status_code == 200:
-                print(f"[BACKEND] Existing backend is running and healthy", flush=True)
+                logger.info("[BACKEND] Existing backend is running and healthy")
                 backend_ready = True
                 return
         except:
-            print(f"[BACKEND] Port in use but not responding - may need to free port {BACKEND_PORT}", flush=True)
-            print(f"[BACKEND] CRITICAL: Kill existing process on port 5000:", flush=True)
-            print(f"[BACKEND]   netstat -ano | findstr :5000", flush=True)
-            print(f"[BACKEND]   taskkill /PID <pid> /F", flush=True)
+            logger.warning(f"[BACKEND] Port in use but not responding - may need to free port {BACKEND_PORT}")
+            logger.warning("[BACKEND] CRITICAL: Kill existing process on port 5000:")
+            logger.warning("[BACKEND]   netstat -ano | findstr :5000")
+            logger.warning("[BACKEND]   taskkill /PID <pid> /F")
             backend_ready = False
             return
     
@@ -168,19 +209,19 @@ def start_backend():
         for path in paths_to_add:
             if path not in sys.path:
                 sys.path.insert(0, path)
-                print(f"[BACKEND] Added to path: {path}", flush=True)
+                logger.info(f"[BACKEND] Added to path: {path}")
         
         # Try to import api_server
-        print(f"[BACKEND] Attempting to import api_server...", flush=True)
+        logger.info("[BACKEND] Attempting to import api_server...")
         
         # If already imported at module level, use it
         if API_SERVER_AVAILABLE and 'api_server' in sys.modules:
             api_server = sys.modules['api_server']
-            print(f"[BACKEND] ✓ Using pre-imported api_server", flush=True)
+            logger.info("[BACKEND] ✓ Using pre-imported api_server")
         else:
             try:
                 import api_server
-                print(f"[BACKEND] ✓ Successfully imported api_server", flush=True)
+                logger.info("[BACKEND] ✓ Successfully imported api_server")
             except ImportError as ie:
                 # Try to find api_server.py file
                 api_server_path = None
@@ -188,7 +229,7 @@ def start_backend():
                     test_path = Path(path) / "api_server.py"
                     if test_path.exists():
                         api_server_path = test_path
-                        print(f"[BACKEND] Found api_server.py at: {api_server_path}", flush=True)
+                        logger.info(f"[BACKEND] Found api_server.py at: {api_server_path}")
                         break
                 
                 if api_server_path:
@@ -198,56 +239,59 @@ def start_backend():
                     if spec and spec.loader:
                         api_server = importlib.util.module_from_spec(spec)
                         spec.loader.exec_module(api_server)
-                        print(f"[BACKEND] ✓ Loaded api_server from file path", flush=True)
+                        logger.info("[BACKEND] ✓ Loaded api_server from file path")
                     else:
                         raise ImportError(f"Could not load api_server from {api_server_path}")
                 else:
-                    print(f"[BACKEND ERROR] api_server.py not found in any path", flush=True)
+                    logger.error("[BACKEND ERROR] api_server.py not found in any path")
                     for path in paths_to_add:
-                        print(f"  - Checked: {path}", flush=True)
+                        logger.error(f"  - Checked: {path}")
                     raise ie
         
         # Start Flask app in a thread
         def run_backend():
             global backend_ready
             try:
-                print(f"[BACKEND] Starting Flask app...", flush=True)
-                sys.stdout.flush()
+                logger.info("[BACKEND] Starting Flask app...")
                 # Disable Flask's reloader and debug mode for production
                 # Set threaded=True for concurrent requests
-                print(f"[BACKEND] Flask app starting on 0.0.0.0:{BACKEND_PORT}", flush=True)
-                api_server.app.run(host='0.0.0.0', port=BACKEND_PORT, debug=False, use_reloader=False, threaded=True)
+                logger.info(f"[BACKEND] Flask app starting on 0.0.0.0:{BACKEND_PORT}")
+                # make_server binds immediately, so readiness can be signalled before serving
+                from werkzeug.serving import make_server
+                server = make_server('0.0.0.0', BACKEND_PORT, api_server.app, threaded=True)
+                backend_ready = True
+                backend_bound.set()
+                server.serve_forever()
             except OSError as e:
                 if 'address already in use' in str(e).lower():
-                    print(f"[BACKEND ERROR] Port {BACKEND_PORT} already in use!", flush=True)
-                    print(f"[BACKEND] Another instance may be running. Kill it with:", flush=True)
-                    print(f"[BACKEND]   netstat -ano | findstr :{BACKEND_PORT}", flush=True)
+                    logger.error(f"[BACKEND ERROR] Port {BACKEND_PORT} already in use!")
+                    logger.error("[BACKEND] Another instance may be running. Kill it with:")
+                    logger.error(f"[BACKEND]   netstat -ano | findstr :{BACKEND_PORT}")
                 else:
-                    print(f"[BACKEND ERROR] OS error: {e}", flush=True)
-                import traceback
-                traceback.print_exc()
+                    logger.error(f"[BACKEND ERROR] OS error: {e}")
                 backend_ready = False
             except Exception as e:
-                print(f"[BACKEND ERROR] Flask run error: {e}", flush=True)
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"[BACKEND ERROR] Flask run error: {e}")
                 backend_ready = False
+            finally:
+                # Wake start_backend even if the server never bound
+                backend_bound.set()
+                stopped_services.put("Backend")
         
         backend_thread = threading.Thread(target=run_backend, daemon=True)
         backend_thread.start()
         
         # Wait for backend to start
-        print(f"[BACKEND] Waiting for backend to respond...", flush=True)
-        if wait_for_service(f"{BACKEND_URL}/api/health", "Backend", timeout=15):
-            print(f"[BACKEND] ✓ Started successfully", flush=True)
-            backend_ready = True
-        else:
-            print(f"[BACKEND] ⚠ Started but not responding yet (may still be initializing)", flush=True)
+        logger.info("[BACKEND] Waiting for backend to respond...")
+        if not backend_bound.wait(timeout=15):
+            logger.warning("[BACKEND] ⚠ Started but not responding yet (may still be initializing)")
             backend_ready = True  # Assume it's starting
+        elif backend_ready:
+            logger.info("[BACKEND] ✓ Started successfully")
+        else:
+            logger.error("[BACKEND ERROR] Backend server failed to start")
     except Exception as e:
-        print(f"[BACKEND ERROR] Failed to start: {e}", flush=True)
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[BACKEND ERROR] Failed to start: {e}")
         backend_ready = False
 
 
@@ -255,19 +299,19 @@ def start_frontend():
     """Start the HTML frontend server"""
     global frontend_thread, frontend_ready
     
-    print(f"[FRONTEND] Starting web server on port {FRONTEND_PORT}...")
+    logger.info(f"[FRONTEND] Starting web server on port {FRONTEND_PORT}...")
     
     # Check if port is already in use
     if check_port(FRONTEND_PORT):
-        print(f"[FRONTEND] Port {FRONTEND_PORT} is already in use")
+        logger.info(f"[FRONTEND] Port {FRONTEND_PORT} is already in use")
         try:
             response = requests.get(FRONTEND_URL, timeout=2)
             if response.status_code == 200:
-                print(f"[FRONTEND] Existing frontend is running")
+                logger.info("[FRONTEND] Existing frontend is running")
                 frontend_ready = True
                 return
         except:
-            print(f"[FRONTEND] Port in use but not responding")
+            logger.warning("[FRONTEND] Port in use but not responding")
             frontend_ready = False
             return
     
@@ -282,22 +326,44 @@ def start_frontend():
     for path in possible_paths:
         if path.exists():
             html_file = path
-            print(f"[FRONTEND] Found HTML file at: {html_file}", flush=True)
+            logger.info(f"[FRONTEND] Found HTML file at: {html_file}")
             break
     
     if not html_file or not html_file.exists():
-        print(f"[FRONTEND ERROR] HTML file not found in any location:", flush=True)
+        logger.error("[FRONTEND ERROR] HTML file not found in any location:")
         for path in possible_paths:
-            print(f"  - {path} (exists: {path.exists()})", flush=True)
+            logger.error(f"  - {path} (exists: {path.exists()})")
         frontend_ready = False
         return
     
-    # Create custom request handler
-    class SecureHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
-        def list_directory(self, path):
-            self.send_error(403, "Forbidden")
-            return None
-        
+    # Allowed HTML files - check multiple locations once, the bundled pages don't change while running
+    page_files = {"nexus.html": html_file}
+    for page_name in ("login.html", "change-password.html"):
+        for path in (BASE_DIR / page_name, APP_DIR / page_name, Path(page_name)):
+            if path.exists():
+                page_files[page_name] = path
+                break
+    
+    # Cache complete page responses (plain + gzip) so each request is a single in-memory write
+    cached_pages = {}
+    for page_name, page_path in page_files.items():
+        content = page_path.read_bytes()
+        gzipped = gzip.compress(content)
+        page_headers = [('Content-Type', 'text/html; charset=utf-8'), ('Vary', 'Accept-Encoding')]
+        cached_pages[page_name] = (
+            build_static_response('HTTP/1.0 200 OK', page_headers + [('Content-Length', len(content))], content),
+            build_static_response('HTTP/1.0 200 OK', page_headers + [('Content-Encoding', 'gzip'), ('Content-Length', len(gzipped))], gzipped),
+        )
+    
+    # Root path redirect to the login page (authentication will handle routing), prebuilt once
+    root_redirect, _ = build_static_response('HTTP/1.0 302 Found', [('Location', '/login.html'), ('Content-Length', 0)])
+    
+    # Create custom request handler - only the pages above and the API proxy are served,
+    # so the base handler is used instead of SimpleHTTPRequestHandler's file-serving machinery
+    class SecureHTTPRequestHandler(http.server.BaseHTTPRequestHandler):
+        # Set TCP_NODELAY on each connection so small redirect/error responses aren't held back by Nagle
+        disable_nagle_algorithm = True
+
         def _proxy_api_request(self, method='GET'):
             """Proxy API requests to the backend server"""
             try:
@@ -317,14 +383,8 @@ def start_frontend():
                     self.wfile.write(json.dumps(error_response).encode('utf-8'))
                     return
                 
-                import urllib.parse
                 # Get the full path including query string
-                full_path = self.path
-                if '?' in full_path:
-                    path, query = full_path.split('?', 1)
-                else:
-                    path = full_path
-                    query = ''
+                path, _, query = self.path.partition('?')
                 
                 # Build backend URL
                 backend_url = f"{BACKEND_URL}{path}"
@@ -334,12 +394,12 @@ def start_frontend():
                 # Get request headers (excluding host)
                 headers = {}
                 for header_name, header_value in self.headers.items():
-                    if header_name.lower() not in ['host', 'connection']:
+                    if header_name.lower() not in PROXY_SKIP_REQUEST_HEADERS:
                         headers[header_name] = header_value
                 
                 # Get request body for POST/PUT/PATCH
                 body = None
-                if method in ['POST', 'PUT', 'PATCH']:
+                if method in PROXY_BODY_METHODS:
                     content_length = self.headers.get('Content-Length')
                     if content_length:
                         body = self.rfile.read(int(content_length))
@@ -347,13 +407,13 @@ def start_frontend():
                 # Make request to backend with shorter timeout for faster failure
                 try:
                     if method == 'GET':
-                        response = requests.get(backend_url, headers=headers, timeout=5)
+                        response = proxy_session.get(backend_url, headers=headers, timeout=5)
                     elif method == 'POST':
-                        response = requests.post(backend_url, headers=headers, data=body, timeout=5)
+                        response = proxy_session.post(backend_url, headers=headers, data=body, timeout=5)
                     elif method == 'PUT':
-                        response = requests.put(backend_url, headers=headers, data=body, timeout=5)
+                        response = proxy_session.put(backend_url, headers=headers, data=body, timeout=5)
                     elif method == 'DELETE':
-                        response = requests.delete(backend_url, headers=headers, timeout=5)
+                        response = proxy_session.delete(backend_url, headers=headers, timeout=5)
                     else:
                         error_response = {'success': False, 'error': 'Method not allowed', 'code': 'METHOD_NOT_ALLOWED'}
                         self.send_response(405)
@@ -375,7 +435,7 @@ def start_frontend():
                     import json
                     self.end_headers()
                     self.wfile.write(json.dumps(error_response).encode('utf-8'))
-                    print(f"[PROXY ERROR] Backend connection refused: {ce}", flush=True)
+                    logger.error(f"[PROXY ERROR] Backend connection refused: {ce}")
                     return
                 except requests.exceptions.Timeout:
                     # Backend timeout - return JSON error
@@ -395,14 +455,12 @@ def start_frontend():
                 self.send_response(response.status_code)
                 # Forward headers (excluding some that shouldn't be forwarded)
                 for header_name, header_value in response.headers.items():
-                    if header_name.lower() not in ['content-encoding', 'transfer-encoding', 'connection']:
+                    if header_name.lower() not in PROXY_SKIP_RESPONSE_HEADERS:
                         self.send_header(header_name, header_value)
                 self.end_headers()
                 self.wfile.write(response.content)
             except Exception as e:
-                print(f"[PROXY ERROR] Failed to proxy API request: {e}", flush=True)
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"[PROXY ERROR] Failed to proxy API request: {e}")
                 # Return JSON error instead of HTML
                 error_response = {
                     'success': False,
@@ -415,9 +473,20 @@ def start_frontend():
                 self.end_headers()
                 self.wfile.write(json.dumps(error_response).encode('utf-8'))
 
+        def _send_cached_page(self, page_name, head_only=False):
+            """Send a cached HTML page, gzip-encoded when the client accepts it"""
+            plain_response, gzip_response = cached_pages[page_name]
+            use_gzip = accepts_gzip(self.headers.get('Accept-Encoding', ''))
+            response, header_length = gzip_response if use_gzip else plain_response
+            self.log_request(200)
+            self.wfile.write(memoryview(response)[:header_length] if head_only else response)
+
+        def _clean_path(self):
+            """Request path without the query string or leading slash"""
+            return self.path.partition('?')[0].lstrip('/').strip()
+
         def do_GET(self):
-            path = self.path.split('?')[0]
-            clean_path = path.lstrip('/').strip()
+            clean_path = self._clean_path()
             
             # Proxy API requests to backend
             if clean_path.startswith('api/'):
@@ -426,76 +495,37 @@ def start_frontend():
             
             if clean_path == "" or clean_path == "/":
                 # Default redirect to login page (authentication will handle routing)
-                self.send_response(302)
-                self.send_header('Location', '/login.html')
-                self.end_headers()
+                self.log_request(302)
+                self.wfile.write(root_redirect)
                 return
             
             # Special routes that should serve the main app
             if clean_path == "app" or clean_path == "tool":
                 # Serve main application HTML
-                if html_file and html_file.exists():
-                    with open(html_file, 'rb') as f:
-                        content = f.read()
-                    self.send_response(200)
-                    self.send_header('Content-Type', 'text/html; charset=utf-8')
-                    self.send_header('Content-Length', str(len(content)))
-                    self.end_headers()
-                    self.wfile.write(content)
-                else:
-                    self.send_error(404, "Main application file not found")
+                self._send_cached_page("nexus.html")
                 return
             
-            # Allowed HTML files - check multiple locations
-            login_paths = [
-                BASE_DIR / "login.html",
-                APP_DIR / "login.html",
-                Path("login.html")
-            ]
-            login_file = None
-            for path in login_paths:
-                if path.exists():
-                    login_file = path
-                    break
-            
-            change_pwd_paths = [
-                BASE_DIR / "change-password.html",
-                APP_DIR / "change-password.html",
-                Path("change-password.html")
-            ]
-            change_pwd_file = None
-            for path in change_pwd_paths:
-                if path.exists():
-                    change_pwd_file = path
-                    break
-            
-            allowed_files = {
-                "nexus.html": html_file,
-            }
-            if login_file:
-                allowed_files["login.html"] = login_file
-            if change_pwd_file:
-                allowed_files["change-password.html"] = change_pwd_file
-            
-            if clean_path in allowed_files:
-                file_path = allowed_files[clean_path]
-                if file_path.exists():
-                    with open(file_path, 'rb') as f:
-                        content = f.read()
-                    self.send_response(200)
-                    self.send_header('Content-Type', 'text/html; charset=utf-8')
-                    self.send_header('Content-Length', str(len(content)))
-                    self.end_headers()
-                    self.wfile.write(content)
-                else:
-                    self.send_error(404, "File not found")
+            if clean_path in cached_pages:
+                self._send_cached_page(clean_path)
+            else:
+                self.send_error(404, "File not found")
+
+        def do_HEAD(self):
+            """Handle HEAD requests for the cached pages without touching the filesystem"""
+            clean_path = self._clean_path()
+            if clean_path == "" or clean_path == "/":
+                self.log_request(302)
+                self.wfile.write(root_redirect)
+            elif clean_path == "app" or clean_path == "tool":
+                self._send_cached_page("nexus.html", head_only=True)
+            elif clean_path in cached_pages:
+                self._send_cached_page(clean_path, head_only=True)
             else:
                 self.send_error(404, "File not found")
 
         def do_POST(self):
             """Handle POST requests - proxy API requests to backend"""
-            path = self.path.split('?')[0]
-            clean_path = path.lstrip('/').strip()
+            clean_path = self._clean_path()
             
             # Proxy API requests to backend
             if clean_path.startswith('api/'):
@@ -507,8 +537,7 @@ def start_frontend():
         
         def do_PUT(self):
             """Handle PUT requests - proxy API requests to backend"""
-            path = self.path.split('?')[0]
-            clean_path = path.lstrip('/').strip()
+            clean_path = self._clean_path()
             
             # Proxy API requests to backend
             if clean_path.startswith('api/'):
@@ -520,8 +549,7 @@ def start_frontend():
         
         def do_DELETE(self):
             """Handle DELETE requests - proxy API requests to backend"""
-            path = self.path.split('?')[0]
-            clean_path = path.lstrip('/').strip()
+            clean_path = self._clean_path()
             
             # Proxy API requests to backend
             if clean_path.startswith('api/'):
@@ -543,13 +571,12 @@ def start_frontend():
                     status_code = None
                     
                     # Look for IP address pattern
-                    import re
-                    ip_match = re.search(r'\b(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\b', log_line)
+                    ip_match = LOG_IP_RE.search(log_line)
                     if ip_match:
                         client_ip = ip_match.group(1)
                     
                     # Look for status code (400, 404, etc.)
-                    status_match = re.search(r'\b(400|404|403)\b', log_line)
+                    status_match = LOG_STATUS_RE.search(log_line)
                     if status_match:
                         status_code = int(status_match.group(1))
                     
@@ -577,41 +604,81 @@ def start_frontend():
         try:
             os.chdir(APP_DIR)  # Ensure we're in the right directory
             Handler = SecureHTTPRequestHandler
-            # Allow reuse of address to prevent "Address already in use" errors
-            socketserver.TCPServer.allow_reuse_address = True
-            httpd = socketserver.TCPServer(("0.0.0.0", FRONTEND_PORT), Handler)
-            httpd.allow_reuse_address = True
+            # Threaded server so a slow proxied API call doesn't block page loads for other clients.
+            # ThreadingHTTPServer already sets allow_reuse_address and daemon_threads.
+            httpd = http.server.ThreadingHTTPServer(("0.0.0.0", FRONTEND_PORT), Handler)
             frontend_ready = True
-            print(f"[FRONTEND] ✓ Started successfully on port {FRONTEND_PORT}", flush=True)
-            sys.stdout.flush()
+            frontend_bound.set()
+            logger.info(f"[FRONTEND] ✓ Started successfully on port {FRONTEND_PORT}")
             httpd.serve_forever()
         except OSError as e:
             if 'address already in use' in str(e).lower():
-                print(f"[FRONTEND ERROR] Port {FRONTEND_PORT} already in use!", flush=True)
-                print(f"[FRONTEND] Another instance may be running. Kill it with:", flush=True)
-                print(f"[FRONTEND]   netstat -ano | findstr :{FRONTEND_PORT}", flush=True)
-                print(f"[FRONTEND]   taskkill /PID <pid> /F", flush=True)
+                logger.error(f"[FRONTEND ERROR] Port {FRONTEND_PORT} already in use!")
+                logger.error("[FRONTEND] Another instance may be running. Kill it with:")
+                logger.error(f"[FRONTEND]   netstat -ano | findstr :{FRONTEND_PORT}")
+                logger.error("[FRONTEND]   taskkill /PID <pid> /F")
             else:
-                print(f"[FRONTEND ERROR] OS error: {e}", flush=True)
-            import traceback
-            traceback.print_exc()
+                logger.error(f"[FRONTEND ERROR] OS error: {e}")
             frontend_ready = False
         except Exception as e:
-            print(f"[FRONTEND ERROR] {e}", flush=True)
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"[FRONTEND ERROR] {e}")
             frontend_ready = False
+        finally:
+            # Wake start_frontend even if the server never bound
+            frontend_bound.set()
+            stopped_services.put("Frontend")
     
     frontend_thread = threading.Thread(target=run_frontend, daemon=True)
     frontend_thread.start()
     
     # Wait for frontend to start
-    time.sleep(2)
-    if check_port(FRONTEND_PORT):
-        frontend_ready = True
-        print(f"[FRONTEND] ✓ Started successfully")
+    if frontend_bound.wait(timeout=5) and frontend_ready:
+        logger.info("[FRONTEND] ✓ Started successfully")
+    else:
+        logger.warning("[FRONTEND] ⚠ May still be starting...")
+
+
+def open_browser(url):
+    """Open url in the default browser via the OS handler, skipping webbrowser's browser probing"""
+    if sys.platform == 'win32':
+        os.startfile(url)  # ShellExecute
+    elif sys.platform == 'darwin':
+        subprocess.Popen(['open', url])
     else:
-        print(f"[FRONTEND] ⚠ May still be starting...")
+        try:
+            subprocess.Popen(['xdg-open', url], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except FileNotFoundError:
+            webbrowser.open(url)
+
+
+def wait_for_keypress(timeout):
+    """Block until a key is pressed or the timeout expires, so an error window stays readable"""
+    try:
+        interactive = sys.stdin is not None and sys.stdin.isatty()
+    except (OSError, ValueError):
+        interactive = False
+    if not interactive:
+        # No console to read from (redirected, at EOF or closed) - a piped stdin would
+        # wake select immediately, so keep the error visible for the full timeout instead
+        time.sleep(timeout)
+        return
+    if sys.platform == 'win32':
+        import msvcrt
+        # msvcrt has no blocking read with a timeout (getwch waits forever),
+        # so poll kbhit and only read once a key is actually waiting
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if msvcrt.kbhit():
+                msvcrt.getwch()
+                return
+            time.sleep(0.1)
+    else:
+        import select
+        try:
+            select.select([sys.stdin], [], [], timeout)
+        except (OSError, ValueError):
+            # stdin closed or not selectable - keep the error visible for the full timeout
+            time.sleep(timeout)
 
 
 def main():
@@ -626,12 +693,14 @@ def main():
     ╚════════════════════════════════════════════════════════════════╝
     """
     try:
-        print(banner, flush=True)
-        print("", flush=True)
-        print("=" * 70, flush=True)
-        print("LAUNCHER STARTED - Initializing services...", flush=True)
-        print("=" * 70, flush=True)
-        print("", flush=True)
+        sys.stdout.write("\n".join([
+            banner,
+            "",
+            "=" * 70,
+            "LAUNCHER STARTED - Initializing services...",
+            "=" * 70,
+            "",
+        ]) + "\n")
         sys.stdout.flush()
         sys.stderr.flush()
     except Exception as e:
@@ -643,109 +712,88 @@ def main():
             pass
     
     # Start backend
-    print("[MAIN] Starting backend...", flush=True)
+    logger.info("[MAIN] Starting backend...")
     start_backend()
     print(flush=True)
     
-    # Wait for backend to be ready before starting frontend
-    global backend_ready
-    print("[MAIN] Waiting for backend to be ready...", flush=True)
-    max_wait = 20  # Maximum seconds to wait
-    waited = 0
-    while not backend_ready and waited < max_wait:
-        time.sleep(1)
-        waited += 1
-        # Check if backend is actually responding
-        try:
-            response = requests.get(f"{BACKEND_URL}/api/health", timeout=2)
-            if response.status_code == 200:
-                backend_ready = True
-                print(f"[MAIN] ✓ Backend is ready after {waited} seconds", flush=True)
-                break
-        except:
-            if waited % 3 == 0:  # Print status every 3 seconds
-                print(f"[MAIN] Still waiting for backend... ({waited}/{max_wait}s)", flush=True)
-    
+    # start_backend() already waited on backend_bound, so backend_ready is final here
     if not backend_ready:
-        print(f"[MAIN] ⚠ Backend not ready after {max_wait} seconds, starting frontend anyway", flush=True)
-        print(f"[MAIN] ⚠ Some features may not work until backend is ready", flush=True)
+        logger.warning("[MAIN] ⚠ Backend failed to start, starting frontend anyway")
+        logger.warning("[MAIN] ⚠ Some features may not work until backend is ready")
     else:
-        print(f"[MAIN] ✓ Backend confirmed ready", flush=True)
+        logger.info("[MAIN] ✓ Backend confirmed ready")
     
     # Start frontend
-    print("[MAIN] Starting frontend...", flush=True)
+    logger.info("[MAIN] Starting frontend...")
     start_frontend()
     print(flush=True)
     
-    # Wait a moment for everything to initialize
-    time.sleep(2)
-    
     # Open browser
-    print("")
-    print("=" * 70)
-    print(" " * 20 + "SERVICE STATUS")
-    print("=" * 70)
-    
     backend_status = "✓ READY" if backend_ready else "✗ NOT READY"
     frontend_status = "✓ READY" if frontend_ready else "✗ NOT READY"
     
-    print(f"Backend API:  {backend_status:15} - {BACKEND_URL}")
-    print(f"Frontend:     {frontend_status:15} - {FRONTEND_URL}")
-    print("")
+    status_lines = [
+        "",
+        "=" * 70,
+        " " * 20 + "SERVICE STATUS",
+        "=" * 70,
+        f"Backend API:  {backend_status:15} - {BACKEND_URL}",
+        f"Frontend:     {frontend_status:15} - {FRONTEND_URL}",
+        "",
+    ]
     
     if not backend_ready:
-        print("⚠️  WARNING: Backend did not start!")
-        print("   Check error messages above for details.")
-        print("")
+        status_lines += ["⚠️  WARNING: Backend did not start!", "   Check error messages above for details.", ""]
     
     if not frontend_ready:
-        print("⚠️  WARNING: Frontend did not start!")
-        print("   Check error messages above for details.")
-        print("")
+        status_lines += ["⚠️  WARNING: Frontend did not start!", "   Check error messages above for details.", ""]
+    
+    if frontend_ready:
+        status_lines.append("Opening browser...")
+    else:
+        status_lines += ["Frontend not ready. Please check errors above.", f"Try opening manually: {FRONTEND_URL}"]
+    sys.stdout.write("\n".join(status_lines) + "\n")
+    sys.stdout.flush()
     
     if frontend_ready:
-        print("Opening browser...")
         try:
-            webbrowser.open(FRONTEND_URL)
+            open_browser(FRONTEND_URL)
         except:
             print(f"Please open manually: {FRONTEND_URL}")
-    else:
-        print(f"Frontend not ready. Please check errors above.")
-        print(f"Try opening manually: {FRONTEND_URL}")
     
-    print()
-    print("=" * 70)
-    print("Application is running. Keep this window open.")
-    print("Press Ctrl+C to stop all services.")
-    print("=" * 70)
-    print()
+    sys.stdout.write("\n".join([
+        "",
+        "=" * 70,
+        "Application is running. Keep this window open.",
+        "Press Ctrl+C to stop all services.",
+        "=" * 70,
+        "",
+    ]) + "\n")
+    sys.stdout.flush()
     
-    # Keep main thread alive
+    # Keep main thread alive - block until a service thread exits instead of probing its port.
+    # On Windows a blocking Queue.get() is a lock wait that Ctrl+C cannot interrupt (a SIGINT
+    # handler would not run until it returned either), so there the wait wakes once a second
+    # to let KeyboardInterrupt through. POSIX lock waits are interruptible, so it blocks outright.
+    wait_timeout = 1 if sys.platform == 'win32' else None
     try:
         while True:
-            time.sleep(1)
-            # Check if services are still running
-            if backend_ready and not check_port(BACKEND_PORT):
-                print("[WARNING] Backend appears to have stopped")
-            if frontend_ready and not check_port(FRONTEND_PORT):
-                print("[WARNING] Frontend appears to have stopped")
+            try:
+                service_name = stopped_services.get(timeout=wait_timeout)
+            except queue.Empty:
+                continue
+            logger.warning(f"[WARNING] {service_name} appears to have stopped")
     except KeyboardInterrupt:
-        print()
-        print("Shutting down...")
-        print("Services stopped.")
+        sys.stdout.write("\nShutting down...\nServices stopped.\n")
+        sys.stdout.flush()
 
 
 if __name__ == '__main__':
-    # Show immediate startup message
-    print("\n" + "=" * 70)
-    print("NEXUS - STARTING...")
-    print("=" * 70 + "\n")
+    # Show immediate startup message (the trailing blank line forces the console to appear)
+    sys.stdout.write("\n" + "=" * 70 + "\nNEXUS - STARTING...\n" + "=" * 70 + "\n\n\n")
     sys.stdout.flush()
     
     try:
-        # Ensure output is visible
-        print("", flush=True)  # Force console to appear
-        sys.stdout.flush()
         sys.stderr.flush()
         
         # Run main
@@ -753,31 +801,37 @@ if __name__ == '__main__':
     except Exception as e:
         # Critical error - try to show it
         try:
-            print("\n" + "!" * 70)
-            print("CRITICAL ERROR IN LAUNCHER")
-            print("!" * 70)
+            sys.stdout.write("\n" + "!" * 70 + "\nCRITICAL ERROR IN LAUNCHER\n" + "!" * 70 + "\n")
+            sys.stdout.flush()
             error_msg = f"\nError: {str(e)}\n"
             sys.stderr.write(error_msg)
             sys.stderr.flush()
             import traceback
             traceback.print_exc()
-            print("\n" + "!" * 70)
-            print("Press Enter to exit...")
-            print("!" * 70 + "\n")
+            sys.stdout.write("\n" + "!" * 70 + "\nPress Enter to exit...\n" + "!" * 70 + "\n\n")
+            sys.stdout.flush()
         except:
             pass
         # Keep window open so user can see error
         try:
-            print("\n" + "=" * 70)
-            print("CRITICAL ERROR - Application cannot start")
-            print("=" * 70)
-            print("\nPlease check the error messages above.")
-            print("Common issues:")
-            print("  - Port 5000 or 8000 already in use")
-            print("  - Firewall blocking ports")
-            print("  - Missing dependencies")
-            print("\nPress Enter to exit...")
-            input()
+            sys.stdout.write("\n".join([
+                "",
+                "=" * 70,
+                "CRITICAL ERROR - Application cannot start",
+                "=" * 70,
+                "",
+                "Please check the error messages above.",
+                "Common issues:",
+                "  - Port 5000 or 8000 already in use",
+                "  - Firewall blocking ports",
+                "  - Missing dependencies",
+                "",
+                "Press Enter to exit (closes automatically after 60 seconds)...",
+            ]) + "\n")
+            sys.stdout.flush()
+            wait_for_keypress(60)
         except:
-            time.sleep(60)  # Wait 60 seconds so error is visible
+            pass
+        # Hard exit so lingering daemon threads or child pipes can't hold the process open
+        os._exit(1)
 